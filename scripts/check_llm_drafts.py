@@ -9,9 +9,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from cv_compiler.parse.loaders import load_canonical_data
-from cv_compiler.tools.llm_draft_check import collect_draft_issues, load_draft_text
-
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -35,6 +32,10 @@ def main() -> int:
         print(f"Draft file not found: {draft_path}", file=sys.stderr)
         return 2
 
+    # Deferred so `--help` and a missing draft don't pay for the loader and LLM imports.
+    from cv_compiler.parse.loaders import load_canonical_data
+    from cv_compiler.tools.llm_draft_check import collect_draft_issues, load_draft_text
+
     try:
         data = load_canonical_data(Path(args.data))
     except Exception as exc:  # noqa: BLE001
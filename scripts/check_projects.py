@@ -11,6 +11,8 @@ from pathlib import Path
 
 from cv_compiler.tools.project_check import collect_project_issues
 
+_CACHE_PATH = Path(".cache") / "cv-compiler" / "project_check.json"
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -22,11 +24,17 @@ def main() -> int:
         default="data",
         help="Path to canonical data directory (default: ./data).",
     )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=f"Reuse results for unchanged files via {_CACHE_PATH} (default: on).",
+    )
     args = parser.parse_args()
     data_dir = Path(args.data)
     projects_dir = data_dir / "projects"
 
-    issues = collect_project_issues(projects_dir)
+    issues = collect_project_issues(projects_dir, cache_path=_CACHE_PATH if args.cache else None)
     errors = 0
     for issue in issues:
         where = f" ({issue.path})"
@@ -9,10 +9,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from cv_compiler.llm.codex import CodexExecConfig, CodexExecProvider
-from cv_compiler.parse.loaders import load_canonical_data, load_job_spec
-from cv_compiler.pipeline import _format_experience_summary
-
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -43,6 +39,11 @@ def main() -> int:
         print(f"Summary already exists: {summary_path}", file=sys.stderr)
         return 0
 
+    # Deferred so `--help` and early exits don't pay for the pipeline and LLM imports.
+    from cv_compiler.llm.codex import CodexExecConfig, CodexExecProvider
+    from cv_compiler.parse.loaders import load_canonical_data, load_job_spec
+    from cv_compiler.pipeline import _format_experience_summary
+
     try:
         data = load_canonical_data(data_dir)
     except Exception as exc:  # noqa: BLE001
@@ -50,7 +51,11 @@ def main() -> int:
         return 2
 
     job = load_job_spec(Path(args.job)) if args.job else None
-    provider = CodexExecProvider(CodexExecConfig.from_env(env_path=Path("config/llm.env")))
+    try:
+        provider = CodexExecProvider(CodexExecConfig.from_env(env_path=Path("config/llm.env")))
+    except ValueError as exc:
+        print(f"{exc}. Install codex or set CV_CODEX_CMD.", file=sys.stderr)
+        return 2
     try:
         summary = provider.generate_experience_summary(tuple(data.projects), job)
     except Exception as exc:  # noqa: BLE001
@@ -8,22 +8,35 @@ from __future__ import annotations
 
 import argparse
 import ast
+import os
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-
-EXCLUDED_DIR_NAMES = {
-    ".git",
-    ".venv",
-    ".uv-cache",
-    ".ruff_cache",
-    ".pytest_cache",
-    "__pycache__",
-    "out",
-    "dist",
-    "build",
-}
-
+from typing import TextIO
+
+EXCLUDED_DIR_NAMES = frozenset(
+    {
+        ".git",
+        ".venv",
+        ".uv-cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        "__pycache__",
+        "out",
+        "dist",
+        "build",
+    }
+)
+
+# Walked for Python modules, but left out of the "Other Files" listing.
+OTHER_FILES_EXCLUDED_DIR_NAMES = frozenset({"tmp"})
+
+# Statement-list fields that can hold nested imports (if/try/with/def/class/match bodies).
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+_DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
 
 DOCSTRING_HINTS: dict[str, str] = {
     "src/cv_compiler/cli.py": "CLI argument parsing and command dispatch.",
@@ -45,6 +58,7 @@ DOCSTRING_HINTS: dict[str, str] = {
 @dataclass(frozen=True, slots=True)
 class PythonModuleInfo:
     path: Path
+    rel_posix: str
     module: str
     doc: str | None
     defined: tuple[str, ...]
@@ -53,35 +67,37 @@ class PythonModuleInfo:
     external_import_roots: tuple[str, ...]
 
 
+def _scandir_recursive(path: Path | str) -> Iterator[os.DirEntry[str]]:
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name in EXCLUDED_DIR_NAMES:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 def _iter_files(root: Path) -> list[Path]:
-    files: list[Path] = []
-    for path in root.rglob("*"):
-        if any(part in EXCLUDED_DIR_NAMES for part in path.parts):
-            continue
-        if path.is_file():
-            files.append(path)
-    return sorted(files)
+    return sorted(Path(entry.path) for entry in _scandir_recursive(root))
 
 
-def _module_name_for_path(path: Path) -> str | None:
-    try:
-        rel = path.relative_to(Path.cwd())
-    except ValueError:
+def _module_name_for_path(rel_posix: str) -> str | None:
+    if not rel_posix.endswith(".py"):
+        return None
+    top, _, rest = rel_posix.partition("/")
+    if not rest:
         return None
 
-    if rel.parts[:1] == ("src",) and rel.suffix == ".py":
-        parts = list(rel.parts[1:])
-        if parts[-1] == "__init__.py":
-            parts = parts[:-1]
-        else:
-            parts[-1] = parts[-1].removesuffix(".py")
+    if top == "src":
+        parts = rest.removesuffix(".py").split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
         return ".".join(parts)
 
-    if rel.parts[:1] == ("tests",) and rel.suffix == ".py":
-        return f"tests.{rel.stem}"
-
-    if rel.parts[:1] == ("scripts",) and rel.suffix == ".py":
-        return f"scripts.{rel.stem}"
+    if top in ("tests", "scripts"):
+        stem = rest.rpartition("/")[2].removesuffix(".py")
+        return f"{top}.{stem}"
 
     return None
 
@@ -101,74 +117,101 @@ def _resolve_relative_module(
     return ".".join(base)
 
 
-def _extract_imports(tree: ast.AST, *, current_module: str, is_package: bool) -> list[str]:
-    imports: list[str] = []
-    for node in ast.walk(tree):
+def _scan_module(
+    tree: ast.Module, *, current_module: str, is_package: bool
+) -> tuple[str | None, tuple[str, ...], set[str]]:
+    """
+    Collect the docstring, top-level definitions, and imports in one pass.
+
+    Only statement blocks are visited (expressions are never entered), so imports nested in
+    functions or conditionals are still found without walking every node of the tree.
+    """
+    defined: list[str] = []
+    imports: set[str] = set()
+    stack: list[tuple[ast.AST, bool]] = [(node, True) for node in reversed(tree.body)]
+    while stack:
+        node, top_level = stack.pop()
         if isinstance(node, ast.Import):
-            imports.extend(alias.name for alias in node.names)
-        elif isinstance(node, ast.ImportFrom):
+            imports.update(alias.name for alias in node.names)
+            continue
+        if isinstance(node, ast.ImportFrom):
             if node.level and node.level > 0:
                 base = _resolve_relative_module(
                     current_module, level=node.level, module=node.module, is_package=is_package
                 )
             else:
                 base = node.module or ""
-
             if base:
-                imports.append(base)
-
-            for alias in node.names:
-                if not base:
-                    continue
-                imports.append(f"{base}.{alias.name}")
+                imports.add(base)
+                imports.update(f"{base}.{alias.name}" for alias in node.names)
+            continue
+        if top_level and isinstance(node, _DEFINITION_NODES):
+            defined.append(node.name)
+        for field in _BLOCK_FIELDS:
+            for child in reversed(getattr(node, field, ())):
+                stack.append((child, False))
 
-    return imports
+    return ast.get_docstring(tree), tuple(sorted(defined)), imports
 
 
-def _defined_symbols(tree: ast.AST) -> tuple[str, ...]:
-    defined: list[str] = []
-    for node in tree.body if isinstance(tree, ast.Module) else []:  # type: ignore[attr-defined]
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            defined.append(node.name)
-    return tuple(sorted(defined))
+def _line_end(source: bytes, start: int) -> int:
+    end = source.find(b"\n", start)
+    return len(source) if end == -1 else end + 1
 
 
-def _ensure_module_docstring(path: Path, *, module_name: str, fallback: str) -> str:
-    text = path.read_text(encoding="utf-8")
-    tree = ast.parse(text)
+def _ensure_module_docstring(
+    path: Path,
+    *,
+    rel_posix: str,
+    source: bytes,
+    tree: ast.Module,
+    module_name: str,
+    fallback: str,
+) -> str:
+    """
+    Backfill a missing module docstring and return the module's docstring.
+
+    The inserted docstring is returned directly, so callers can keep using the original tree
+    (only line numbers shift) instead of re-parsing the rewritten file. The splice works on raw
+    bytes, so the file is never decoded/re-encoded, and the inserted lines use the file's own
+    newline (CRLF or LF, taken from its first line).
+    """
     existing = ast.get_docstring(tree)
     if existing:
         return existing.strip()
 
-    rel = path.relative_to(Path.cwd()).as_posix()
-    summary = DOCSTRING_HINTS.get(rel) or fallback
-    doc = f'"""{summary}"""\n\n'
+    summary = DOCSTRING_HINTS.get(rel_posix) or fallback
+    newline = b"\r\n" if b"\r\n" in source[: _line_end(source, 0)] else b"\n"
+    doc = f'"""{summary}"""'.encode() + newline * 2
 
-    lines = text.splitlines(keepends=True)
     insert_at = 0
-
-    if lines and lines[0].startswith("#!"):
-        insert_at = 1
-    if len(lines) > insert_at and "coding" in lines[insert_at]:
-        insert_at += 1
-
-    new_text = "".join(lines[:insert_at]) + doc + "".join(lines[insert_at:])
-    path.write_text(new_text, encoding="utf-8")
+    if source.startswith(b"#!"):
+        insert_at = _line_end(source, insert_at)
+    if b"coding" in source[insert_at : _line_end(source, insert_at)]:
+        insert_at = _line_end(source, insert_at)
+
+    if insert_at and not source[:insert_at].endswith(b"\n"):
+        # A shebang/coding line at EOF without a newline would swallow the docstring.
+        doc = newline + doc
+    path.write_bytes(source[:insert_at] + doc + source[insert_at:])
     return summary
 
 
 def _build_module_info(
-    py_path: Path, module_name: str, local_modules: dict[str, Path]
+    py_path: Path,
+    module_name: str,
+    local_modules: dict[str, Path],
+    *,
+    rel_posix: str,
+    tree: ast.Module,
+    doc: str | None = None,
 ) -> PythonModuleInfo:
-    text = py_path.read_text(encoding="utf-8")
-    tree = ast.parse(text)
-    doc = ast.get_docstring(tree)
-    defined = _defined_symbols(tree)
-
-    imported = _extract_imports(
+    scanned_doc, defined, imported = _scan_module(
         tree, current_module=module_name, is_package=_is_package_file(py_path)
     )
-    imported_modules = sorted(set(imported))
+    if doc is None:
+        doc = scanned_doc
+    imported_modules = sorted(imported)
 
     local_imports: set[str] = set()
     external_roots: set[str] = set()
@@ -191,6 +234,7 @@ def _build_module_info(
 
     return PythonModuleInfo(
         path=py_path,
+        rel_posix=rel_posix,
         module=module_name,
         doc=doc.strip() if doc else None,
         defined=defined,
@@ -200,66 +244,78 @@ def _build_module_info(
     )
 
 
+def _analyze_file(
+    py_path: Path,
+    module_name: str,
+    rel_posix: str,
+    *,
+    local_modules: dict[str, Path],
+    write_docstrings: bool,
+) -> PythonModuleInfo:
+    """Read, parse, and summarize one module; safe to run in a worker process."""
+    source = py_path.read_bytes()
+    tree = ast.parse(source)
+    doc = None
+    if write_docstrings:
+        # Each file is owned by exactly one task, so backfilling here cannot race.
+        doc = _ensure_module_docstring(
+            py_path,
+            rel_posix=rel_posix,
+            source=source,
+            tree=tree,
+            module_name=module_name,
+            fallback=f"Module {module_name}.",
+        )
+    return _build_module_info(
+        py_path, module_name, local_modules, rel_posix=rel_posix, tree=tree, doc=doc
+    )
+
+
 def _render_markdown_index(
+    out: TextIO,
     *,
     python_modules: list[PythonModuleInfo],
-    local_modules: dict[str, Path],
     reverse_edges: dict[str, list[str]],
-    other_files: list[Path],
-) -> str:
-    lines: list[str] = []
-    lines.append("# Project Index")
-    lines.append("")
-    lines.append("Deterministic index of files + local import connections (includes tests).")
-    lines.append("")
-    lines.append("## Overview")
-    lines.append("")
-    lines.append(f"- Python modules indexed: {len(python_modules)}")
-    lines.append(f"- Other files indexed: {len(other_files)}")
-    lines.append("")
-
-    lines.append("## Python Modules")
-    lines.append("")
+    other_files: list[str],
+) -> None:
+    write = out.write
+    write("# Project Index\n\n")
+    write("Deterministic index of files + local import connections (includes tests).\n\n")
+    write("## Overview\n\n")
+    write(f"- Python modules indexed: {len(python_modules)}\n")
+    write(f"- Other files indexed: {len(other_files)}\n\n")
+
+    write("## Python Modules\n\n")
+    rel_by_module = {info.module: info.rel_posix for info in python_modules}
     for info in sorted(python_modules, key=lambda m: m.path.as_posix()):
-        rel = info.path.relative_to(Path.cwd()).as_posix()
-        lines.append(f"### `{rel}`")
-        lines.append("")
-        lines.append(f"- Module: `{info.module}`")
-        lines.append(f"- Doc: {info.doc.splitlines()[0] if info.doc else '(none)'}")
-        lines.append(
-            f"- Defines: {', '.join(f'`{d}`' for d in info.defined) if info.defined else '(none)'}"
-        )
+        write(f"### `{info.rel_posix}`\n\n")
+        write(f"- Module: `{info.module}`\n")
+        write(f"- Doc: {info.doc.splitlines()[0] if info.doc else '(none)'}\n")
+        defined = ", ".join(f"`{d}`" for d in info.defined) if info.defined else "(none)"
+        write(f"- Defines: {defined}\n")
 
         if info.local_imports:
-            rendered = ", ".join(
-                f"`{m}` → `{local_modules[m].relative_to(Path.cwd()).as_posix()}`"
-                for m in info.local_imports
-            )
-            lines.append(f"- Imports (local): {rendered}")
+            rendered = ", ".join(f"`{m}` → `{rel_by_module[m]}`" for m in info.local_imports)
+            write(f"- Imports (local): {rendered}\n")
         else:
-            lines.append("- Imports (local): (none)")
+            write("- Imports (local): (none)\n")
 
         imported_by = sorted(reverse_edges.get(info.module, []))
         if imported_by:
             rendered = ", ".join(f"`{m}`" for m in imported_by)
-            lines.append(f"- Imported by (local): {rendered}")
+            write(f"- Imported by (local): {rendered}\n")
         else:
-            lines.append("- Imported by (local): (none)")
+            write("- Imported by (local): (none)\n")
 
         if info.external_import_roots:
             external = ", ".join(f"`{r}`" for r in info.external_import_roots)
-            lines.append(f"- External import roots: {external}")
+            write(f"- External import roots: {external}\n\n")
         else:
-            lines.append("- External import roots: (none)")
-        lines.append("")
+            write("- External import roots: (none)\n\n")
 
-    lines.append("## Other Files")
-    lines.append("")
-    for path in other_files:
-        rel = path.relative_to(Path.cwd()).as_posix()
-        lines.append(f"- `{rel}`")
-    lines.append("")
-    return "\n".join(lines)
+    write("## Other Files\n\n")
+    for rel in other_files:
+        write(f"- `{rel}`\n")
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -276,28 +332,47 @@ def main(argv: list[str] | None = None) -> int:
         default=Path("docs/PROJECT_INDEX.md"),
         help="Output markdown path.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used to parse modules (1 disables multiprocessing).",
+    )
     args = parser.parse_args(argv)
 
     root = Path.cwd()
+    # Every path comes from walking `root`, so relative paths are a fixed-length slice.
+    cwd_prefix_len = len(root.as_posix()) + 1
     files = _iter_files(root)
 
     python_files = [p for p in files if p.suffix == ".py"]
     other_files = [
-        p for p in files if p.suffix != ".py" and not any(part in {"tmp"} for part in p.parts)
+        p for p in files if p.suffix != ".py" and OTHER_FILES_EXCLUDED_DIR_NAMES.isdisjoint(p.parts)
     ]
 
     local_modules: dict[str, Path] = {}
+    rel_by_module: dict[str, str] = {}
     for py in python_files:
-        mod = _module_name_for_path(py)
+        rel = py.as_posix()[cwd_prefix_len:]
+        mod = _module_name_for_path(rel)
         if mod:
             local_modules[mod] = py
-
-    module_infos: list[PythonModuleInfo] = []
-    for mod, py in sorted(local_modules.items(), key=lambda kv: kv[1].as_posix()):
-        if args.write_docstrings:
-            fallback = f"Module {mod}."
-            _ensure_module_docstring(py, module_name=mod, fallback=fallback)
-        module_infos.append(_build_module_info(py, mod, local_modules))
+            rel_by_module[mod] = rel
+
+    ordered = sorted(local_modules.items(), key=lambda kv: kv[1].as_posix())
+    paths = [py for _, py in ordered]
+    names = [mod for mod, _ in ordered]
+    rels = [rel_by_module[mod] for mod in names]
+    analyze = partial(
+        _analyze_file, local_modules=local_modules, write_docstrings=args.write_docstrings
+    )
+    module_infos: list[PythonModuleInfo]
+    if args.jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            # `map` yields in submission order, keeping the index deterministic.
+            module_infos = list(executor.map(analyze, paths, names, rels, chunksize=8))
+    else:
+        module_infos = list(map(analyze, paths, names, rels))
 
     reverse_edges: dict[str, list[str]] = defaultdict(list)
     for info in module_infos:
@@ -306,15 +381,13 @@ def main(argv: list[str] | None = None) -> int:
 
     out_path: Path = args.out
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
+    with out_path.open("w", encoding="utf-8", buffering=1 << 16) as out:
         _render_markdown_index(
+            out,
             python_modules=module_infos,
-            local_modules=local_modules,
             reverse_edges=reverse_edges,
-            other_files=sorted(other_files),
-        ),
-        encoding="utf-8",
-    )
+            other_files=[p.as_posix()[cwd_prefix_len:] for p in sorted(other_files)],
+        )
     return 0
 
 
@@ -8,22 +8,33 @@ from __future__ import annotations
 
 import argparse
 import ast
-from collections import defaultdict
+import os
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-
-EXCLUDED_DIR_NAMES = {
-    ".git",
-    ".venv",
-    ".uv-cache",
-    ".ruff_cache",
-    ".pytest_cache",
-    "__pycache__",
-    "out",
-    "dist",
-    "build",
-    "tmp",
-}
+from typing import TextIO
+
+EXCLUDED_DIR_NAMES = frozenset(
+    {
+        ".git",
+        ".venv",
+        ".uv-cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        "__pycache__",
+        "out",
+        "dist",
+        "build",
+        "tmp",
+    }
+)
+
+# Statement-list fields that can hold nested imports (if/try/with/def/class/match bodies).
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,28 +43,42 @@ class Stub:
     lineno: int
 
 
+@dataclass(frozen=True, slots=True)
+class ModuleAnalysis:
+    doc: str | None
+    stubs: tuple[Stub, ...]
+    deps: tuple[str, ...]
+
+
+def _scandir_recursive(path: Path | str) -> Iterator[os.DirEntry[str]]:
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name in EXCLUDED_DIR_NAMES:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 def _iter_python_files(root: Path) -> list[Path]:
-    files: list[Path] = []
-    for path in root.rglob("*.py"):
-        if any(part in EXCLUDED_DIR_NAMES for part in path.parts):
-            continue
-        files.append(path)
-    return sorted(files)
+    return sorted(
+        Path(entry.path) for entry in _scandir_recursive(root) if entry.name.endswith(".py")
+    )
 
 
-def _module_name_for_path(path: Path) -> str | None:
-    rel = path.relative_to(Path.cwd())
-    if rel.parts[:1] == ("src",):
-        parts = list(rel.parts[1:])
-        if parts[-1] == "__init__.py":
-            parts = parts[:-1]
-        else:
-            parts[-1] = parts[-1].removesuffix(".py")
+def _module_name_for_path(rel_posix: str) -> str | None:
+    top, _, rest = rel_posix.partition("/")
+    if not rest:
+        return None
+    if top == "src":
+        parts = rest.removesuffix(".py").split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
         return ".".join(parts)
-    if rel.parts[:1] == ("tests",):
-        return f"tests.{rel.stem}"
-    if rel.parts[:1] == ("scripts",):
-        return f"scripts.{rel.stem}"
+    if top in ("tests", "scripts"):
+        stem = rest.rpartition("/")[2].removesuffix(".py")
+        return f"{top}.{stem}"
     return None
 
 
@@ -70,28 +95,31 @@ def _is_not_implemented_raise(stmt: ast.stmt) -> bool:
     return False
 
 
+def _is_docstring_expr(stmt: ast.stmt) -> bool:
+    return (
+        type(stmt) is ast.Expr
+        and isinstance(stmt.value, ast.Constant)
+        and isinstance(stmt.value.value, str)
+    )
+
+
 def _is_stub_body(stmts: list[ast.stmt]) -> bool:
-    remaining = list(stmts)
-    if (
-        remaining
-        and isinstance(remaining[0], ast.Expr)
-        and isinstance(remaining[0].value, ast.Constant)
-    ):
-        if isinstance(remaining[0].value.value, str):
-            remaining = remaining[1:]
-
-    if not remaining:
-        return True
-    if len(remaining) == 1 and isinstance(remaining[0], ast.Pass):
+    start = 1 if stmts and _is_docstring_expr(stmts[0]) else 0
+    count = len(stmts) - start
+    if count == 0:
         return True
-    if len(remaining) == 1 and _is_not_implemented_raise(remaining[0]):
+    if count != 1:
+        return False
+
+    last = stmts[-1]
+    kind = type(last)
+    if kind is ast.Pass:
         return True
-    if (
-        len(remaining) == 1
-        and isinstance(remaining[0], ast.Expr)
-        and isinstance(remaining[0].value, ast.Constant)
-    ):
-        return remaining[0].value.value is Ellipsis
+    if kind is ast.Raise:
+        return _is_not_implemented_raise(last)
+    if kind is ast.Expr:
+        value = last.value  # type: ignore[attr-defined]
+        return isinstance(value, ast.Constant) and value.value is Ellipsis
     return False
 
 
@@ -101,33 +129,33 @@ def _find_stubs(tree: ast.AST) -> tuple[Stub, ...]:
         return ()
 
     for node in tree.body:
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_stub_body(node.body):
+        if isinstance(node, _FUNCTION_NODES) and _is_stub_body(node.body):
             stubs.append(Stub(qualname=node.name, lineno=node.lineno))
         elif isinstance(node, ast.ClassDef):
             for child in node.body:
-                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_stub_body(
-                    child.body
-                ):
+                if isinstance(child, _FUNCTION_NODES) and _is_stub_body(child.body):
                     stubs.append(Stub(qualname=f"{node.name}.{child.name}", lineno=child.lineno))
 
     return tuple(sorted(stubs, key=lambda s: (s.qualname, s.lineno)))
 
 
 def _extract_local_import_edges(
-    path: Path, *, module_name: str, local_modules: set[str]
+    tree: ast.Module, *, module_name: str, local_modules: set[str]
 ) -> tuple[str, ...]:
-    tree = ast.parse(path.read_text(encoding="utf-8"))
     imports: set[str] = set()
-    for node in ast.walk(tree):
+    stack: list[ast.AST] = list(tree.body)
+    while stack:
+        node = stack.pop()
         if isinstance(node, ast.Import):
             imports.update(alias.name for alias in node.names)
         elif isinstance(node, ast.ImportFrom):
             base = node.module or ""
             if base:
                 imports.add(base)
-            for alias in node.names:
-                if base:
-                    imports.add(f"{base}.{alias.name}")
+                imports.update(f"{base}.{alias.name}" for alias in node.names)
+        else:
+            for field in _BLOCK_FIELDS:
+                stack.extend(getattr(node, field, ()))
 
     edges: set[str] = set()
     for mod in imports:
@@ -145,60 +173,63 @@ def _extract_local_import_edges(
     return tuple(sorted(edges))
 
 
+def _analyze_file(path: Path, module_name: str, *, local_modules: set[str]) -> ModuleAnalysis:
+    """Read and parse one module once; pure, so it can run in a worker process."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return ModuleAnalysis(
+        doc=ast.get_docstring(tree),
+        stubs=_find_stubs(tree),
+        deps=_extract_local_import_edges(
+            tree, module_name=module_name, local_modules=local_modules
+        ),
+    )
+
+
 def _render_task_index(
+    out: TextIO,
     *,
     goal: str | None,
     modules: dict[str, Path],
+    rel_paths: dict[str, str],
     doc_by_module: dict[str, str | None],
     stubs_by_module: dict[str, tuple[Stub, ...]],
     deps: dict[str, tuple[str, ...]],
     reverse_deps: dict[str, tuple[str, ...]],
-) -> str:
-    lines: list[str] = []
-    lines.append("# Task Index (Temporary)")
-    lines.append("")
+) -> None:
+    write = out.write
+    write("# Task Index (Temporary)\n\n")
     if goal:
-        lines.append(f"Goal: {goal}")
-        lines.append("")
-    lines.append("This file is generated; edit freely while working, then clear it when done.")
-    lines.append("")
+        write(f"Goal: {goal}\n\n")
+    write("This file is generated; edit freely while working, then clear it when done.\n\n")
 
-    lines.append("## Suggested Order (Dependency-Aware)")
-    lines.append("")
+    write("## Suggested Order (Dependency-Aware)\n\n")
     ordered = _topo_order(modules, deps)
     for mod in ordered:
-        rel = modules[mod].relative_to(Path.cwd()).as_posix()
         stub_count = len(stubs_by_module.get(mod, ()))
-        lines.append(f"- `{rel}` ({stub_count} stubs)")
-    lines.append("")
+        write(f"- `{rel_paths[mod]}` ({stub_count} stubs)\n")
+    write("\n")
 
-    lines.append("## Per-File Tasks")
-    lines.append("")
+    write("## Per-File Tasks\n")
     for mod in ordered:
-        path = modules[mod]
-        rel = path.relative_to(Path.cwd()).as_posix()
-        lines.append(f"### `{rel}`")
-        lines.append("")
+        rel = rel_paths[mod]
+        write(f"\n### `{rel}`\n\n")
         local_deps = deps.get(mod, ())
         imported_by = reverse_deps.get(mod, ())
         doc = doc_by_module.get(mod)
-        lines.append(f"- Module: `{mod}`")
-        lines.append(f"- Doc: {doc.splitlines()[0] if doc else '(none)'}")
-        lines.append(
-            f"- Depends on: {', '.join(f'`{d}`' for d in local_deps) if local_deps else '(none)'}"
-        )
+        write(f"- Module: `{mod}`\n")
+        write(f"- Doc: {doc.splitlines()[0] if doc else '(none)'}\n")
+        deps_text = ", ".join(f"`{d}`" for d in local_deps) if local_deps else "(none)"
+        write(f"- Depends on: {deps_text}\n")
         imported_by_text = ", ".join(f"`{d}`" for d in imported_by) if imported_by else "(none)"
-        lines.append(f"- Imported by: {imported_by_text}")
+        write(f"- Imported by: {imported_by_text}\n")
         stubs = stubs_by_module.get(mod, ())
         if stubs:
-            lines.append("- Tasks:")
+            write("- Tasks:\n")
             for stub in stubs:
-                lines.append(f"  - Implement `{stub.qualname}` (`{rel}:{stub.lineno}`)")
-            lines.append("  - Add/adjust tests for the implemented behavior")
+                write(f"  - Implement `{stub.qualname}` (`{rel}:{stub.lineno}`)\n")
+            write("  - Add/adjust tests for the implemented behavior\n")
         else:
-            lines.append("- Tasks: (none detected)")
-        lines.append("")
-    return "\n".join(lines)
+            write("- Tasks: (none detected)\n")
 
 
 def _topo_order(modules: dict[str, Path], deps: dict[str, tuple[str, ...]]) -> list[str]:
@@ -218,20 +249,18 @@ def _topo_order(modules: dict[str, Path], deps: dict[str, tuple[str, ...]]) -> l
             incoming_count[node] += 1
             outgoing[dep].add(node)
 
-    ready = sorted(
-        [n for n, c in incoming_count.items() if c == 0],
-        key=lambda m: modules[m].as_posix(),
-    )
+    path_key = {m: p.as_posix() for m, p in modules.items()}.__getitem__
+    ready = deque(sorted((n for n, c in incoming_count.items() if c == 0), key=path_key))
     order: list[str] = []
     while ready:
-        node = ready.pop(0)
+        node = ready.popleft()
         order.append(node)
-        for nxt in sorted(outgoing[node], key=lambda m: modules[m].as_posix()):
+        for nxt in sorted(outgoing[node], key=path_key):
             incoming_count[nxt] -= 1
             if incoming_count[nxt] == 0:
                 ready.append(nxt)
 
-    remaining = sorted((all_nodes - set(order)), key=lambda m: modules[m].as_posix())
+    remaining = sorted((all_nodes - set(order)), key=path_key)
     order.extend(remaining)
     return order
 
@@ -252,6 +281,12 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Overwrite the task index with a short 'done' marker.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used to parse modules (1 disables multiprocessing).",
+    )
     args = parser.parse_args(argv)
 
     out_path: Path = args.out
@@ -261,12 +296,17 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     root = Path.cwd()
+    # Every path comes from walking `root`, so relative paths are a fixed-length slice.
+    cwd_prefix_len = len(root.as_posix()) + 1
     python_files = _iter_python_files(root)
     modules: dict[str, Path] = {}
+    rel_paths: dict[str, str] = {}
     for path in python_files:
-        mod = _module_name_for_path(path)
+        rel = path.as_posix()[cwd_prefix_len:]
+        mod = _module_name_for_path(rel)
         if mod:
             modules[mod] = path
+            rel_paths[mod] = rel
 
     local_module_names = set(modules.keys())
 
@@ -275,29 +315,36 @@ def main(argv: list[str] | None = None) -> int:
     deps: dict[str, tuple[str, ...]] = {}
     reverse: dict[str, set[str]] = defaultdict(set)
 
-    for mod, path in modules.items():
-        tree = ast.parse(path.read_text(encoding="utf-8"))
-        doc_by_module[mod] = ast.get_docstring(tree)
-        stubs_by_module[mod] = _find_stubs(tree)
-        deps[mod] = _extract_local_import_edges(
-            path, module_name=mod, local_modules=local_module_names
-        )
-        for dep in deps[mod]:
+    names = list(modules.keys())
+    analyze = partial(_analyze_file, local_modules=local_module_names)
+    analyses: list[ModuleAnalysis]
+    if args.jobs > 1 and len(names) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            # `map` yields in submission order, so results line up with `names`.
+            analyses = list(executor.map(analyze, modules.values(), names, chunksize=8))
+    else:
+        analyses = list(map(analyze, modules.values(), names))
+
+    for mod, analysis in zip(names, analyses, strict=True):
+        doc_by_module[mod] = analysis.doc
+        stubs_by_module[mod] = analysis.stubs
+        deps[mod] = analysis.deps
+        for dep in analysis.deps:
             reverse[dep].add(mod)
 
     reverse_deps: dict[str, tuple[str, ...]] = {k: tuple(sorted(v)) for k, v in reverse.items()}
 
-    out_path.write_text(
+    with out_path.open("w", encoding="utf-8", buffering=1 << 16) as out:
         _render_task_index(
+            out,
             goal=args.goal,
             modules=modules,
+            rel_paths=rel_paths,
             doc_by_module=doc_by_module,
             stubs_by_module=stubs_by_module,
             deps=deps,
             reverse_deps=reverse_deps,
-        ),
-        encoding="utf-8",
-    )
+        )
     return 0
 
 
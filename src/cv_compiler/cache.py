@@ -0,0 +1,44 @@
+"""
+Cache helpers shared across the package.
+
+On-disk caches under `.cache/cv-compiler/` are an optimization only: a failed write is ignored so a
+read-only checkout still works, and entries are replaced atomically so a concurrent reader never
+sees a partial file. In-process caches of parsed files are keyed with `file_stamp`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+
+def file_stamp(path: Path | None) -> tuple[int, int] | None:
+    """
+    Return `(st_mtime_ns, st_size)` for `path`, or None when it is missing or cannot be stat'ed.
+
+    `lru_cache`d file parsers take the path and this stamp as arguments. The stamp is never read
+    inside them; it is there so that an edited file misses the cache and is parsed again.
+    """
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_cache_text(path: Path, text: str) -> None:
+    """Atomically write `text` to `path`, ignoring filesystem errors."""
+    # Unique per process and thread, so concurrent writers never share a temp file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
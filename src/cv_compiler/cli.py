@@ -7,63 +7,69 @@ The heavy lifting is delegated to the pipeline layer.
 
 from __future__ import annotations
 
-import argparse
+import dataclasses
 import os
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cv_compiler.explain import format_selection_explanation
-from cv_compiler.ingest import ingest_pdf_to_markdown
-from cv_compiler.lint.linter import lint_build_inputs
-from cv_compiler.llm import (
-    CodexExecConfig,
-    CodexExecProvider,
-    LLMConfig,
-    ManualProvider,
-    NoopProvider,
-    OpenAIProvider,
-)
-from cv_compiler.llm.config import read_env_file, upsert_env_value
-from cv_compiler.parse.loaders import load_canonical_data, load_job_spec
-from cv_compiler.pipeline import BuildRequest, build_cv
-from cv_compiler.render.types import RenderFormat
-from cv_compiler.select.selector import select_content
-from cv_compiler.types import LintIssue, Severity
-
-
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="cv", description="Compile structured career data into ATS-safe CVs."
-    )
-    sub = parser.add_subparsers(dest="command", required=True)
+from cv_compiler import __version__
+from cv_compiler.types import Severity
+
+if TYPE_CHECKING:
+    import argparse
+
+    from cv_compiler.pipeline import BuildRequest, BuildResult
+    from cv_compiler.types import LintIssue
+
+# Pipeline, LLM, and rendering modules are imported inside the command branches that use them so
+# `cv --help`, argument errors, and light subcommands don't pay for the whole stack.
 
+_EXAMPLES_ROOT = Path("examples")
+_DEFAULT_DATA_DIR = Path("data")
+_DEFAULT_TEMPLATE_DIR = Path("templates")
+_DEFAULT_OUT_DIR = Path("out")
+_JOBS_DIR = Path("jobs")
+_LLM_ENV_PATH = Path("config/llm.env")
+# CVs are a few pages; anything far longer is almost certainly the wrong file.
+_DEFAULT_MAX_PDF_PAGES = 10
+
+# Warning codes hidden unless `--debug` is passed.
+_SUPPRESSED_WARNING_CODES = frozenset({"UNICODE_NON_ASCII"})
+_SEVERITY_LABELS = {severity: severity.value.upper() for severity in Severity}
+
+_VALID_LLM_MODES = frozenset({"api", "offline"})
+# Answers to the interactive mode prompt that select offline mode.
+_OFFLINE_CHOICES = frozenset({"2", "offline", "o"})
+
+
+def _add_build_parser(sub: argparse._SubParsersAction) -> None:
     build = sub.add_parser("build", help="Generate a CV (generic or job-targeted).")
     build_inputs = build.add_mutually_exclusive_group()
     build_inputs.add_argument(
-        "--data", type=str, default=None, help="Path to canonical data directory (default: ./data)."
+        "--data", default=None, help="Path to canonical data directory (default: ./data)."
     )
     build_inputs.add_argument(
         "--example",
-        type=str,
         default=None,
         help="Use a bundled example dataset by name (e.g. basic).",
     )
     build.add_argument(
         "--job",
-        type=str,
         default=None,
         help=(
-            "Path to a job description (e.g. jobs/acme.md). "
-            "Use --job false to force a generic CV."
+            "Path to a job description (e.g. jobs/acme.md). Use --job false to force a generic CV."
         ),
     )
     build.add_argument(
         "--llm",
-        type=str,
         default=None,
+        choices=("openai", "noop", "codex"),
         help=(
-            "Optional LLM provider name (e.g. openai, noop). "
+            "Optional LLM provider name (openai, noop, or codex). "
             "Deterministic build does not require this."
         ),
     )
@@ -84,7 +90,6 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     build.add_argument(
         "--from-markdown",
-        type=str,
         default=None,
         help="Render PDF from an existing Markdown file instead of parsing data.",
     )
@@ -94,13 +99,13 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Show debug-only warnings (e.g., non-ASCII characters).",
     )
 
+
+def _add_lint_parser(sub: argparse._SubParsersAction) -> None:
     lint = sub.add_parser("lint", help="Validate schema and enforce ATS constraints.")
     lint_inputs = lint.add_mutually_exclusive_group()
+    lint_inputs.add_argument("--data", default=None, help="Path to canonical data directory.")
     lint_inputs.add_argument(
-        "--data", type=str, default=None, help="Path to canonical data directory."
-    )
-    lint_inputs.add_argument(
-        "--example", type=str, default=None, help="Use a bundled example dataset by name."
+        "--example", default=None, help="Use a bundled example dataset by name."
     )
     lint.add_argument(
         "--debug",
@@ -108,37 +113,37 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Show debug-only warnings (e.g., non-ASCII characters).",
     )
 
+
+def _add_explain_parser(sub: argparse._SubParsersAction) -> None:
     explain = sub.add_parser("explain", help="Explain deterministic selection decisions.")
     explain.add_argument(
-        "--job", type=str, required=True, help="Path to a job description (e.g. jobs/acme.md)."
+        "--job", required=True, help="Path to a job description (e.g. jobs/acme.md)."
     )
     explain_inputs = explain.add_mutually_exclusive_group()
+    explain_inputs.add_argument("--data", default=None, help="Path to canonical data directory.")
     explain_inputs.add_argument(
-        "--data", type=str, default=None, help="Path to canonical data directory."
-    )
-    explain_inputs.add_argument(
-        "--example", type=str, default=None, help="Use a bundled example dataset by name."
+        "--example", default=None, help="Use a bundled example dataset by name."
     )
 
+
+def _add_ingest_parser(sub: argparse._SubParsersAction) -> None:
     ingest = sub.add_parser(
         "to_mds_from_pdf", help="Extract a PDF CV into canonical Markdown files."
     )
     ingest.add_argument(
         "--data",
-        type=str,
         default=None,
         help="Path to canonical data directory (default: ./data).",
     )
     ingest.add_argument(
         "--pdf",
-        type=str,
         default=None,
         help="Path to the PDF CV (default: <data>/cv.pdf).",
     )
     ingest.add_argument(
         "--llm",
-        type=str,
         default="openai",
+        choices=("openai",),
         help="LLM provider for structuring the PDF text (default: openai).",
     )
     ingest.add_argument(
@@ -146,19 +151,94 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite existing markdown files in the data directory.",
     )
+    ingest.add_argument(
+        "--max-pages",
+        type=int,
+        default=_DEFAULT_MAX_PDF_PAGES,
+        help=f"Reject PDFs with more pages than this (default: {_DEFAULT_MAX_PDF_PAGES}).",
+    )
+
+
+_SUBCOMMAND_PARSERS = {
+    "build": _add_build_parser,
+    "lint": _add_lint_parser,
+    "explain": _add_explain_parser,
+    "to_mds_from_pdf": _add_ingest_parser,
+}
+
+
+def _sniff_subcommand(argv: Sequence[str]) -> str | None:
+    """
+    Return the subcommand named by `argv`, or None when every subparser is needed.
+
+    The top-level parser only accepts `-h` and `--version`, so any flag before the subcommand means
+    top-level help, the version, or an error message; help and errors should list all subcommands.
+    """
+    for arg in argv:
+        if arg.startswith("-"):
+            return None
+        return arg if arg in _SUBCOMMAND_PARSERS else None
+    return None
+
+
+@cache
+def _build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    # Parsers hold no per-parse state (results live on the Namespace), so one per key is reused.
+    import argparse
 
+    parser = argparse.ArgumentParser(
+        prog="cv", description="Compile structured career data into ATS-safe CVs."
+    )
+    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
+    sub = parser.add_subparsers(dest="command", required=True)
+    if only is not None:
+        _SUBCOMMAND_PARSERS[only](sub)
+    else:
+        for add_parser in _SUBCOMMAND_PARSERS.values():
+            add_parser(sub)
     return parser
 
 
+@cache
 def _resolve_example_root(name: str) -> Path:
-    return Path("examples") / name
+    return _EXAMPLES_ROOT / name
+
+
+@dataclass(frozen=True, slots=True)
+class _Paths:
+    example_root: Path | None
+    data_dir: Path
+    template_dir: Path
+    out_dir: Path
+
+
+def _resolve_paths(args: argparse.Namespace) -> _Paths:
+    return _resolve_paths_for(getattr(args, "example", None), args.data)
+
+
+@cache
+def _resolve_paths_for(example: str | None, data: str | None) -> _Paths:
+    example_root = _resolve_example_root(example) if example else None
+    if example_root is None:
+        return _Paths(
+            example_root=None,
+            data_dir=Path(data) if data else _DEFAULT_DATA_DIR,
+            template_dir=_DEFAULT_TEMPLATE_DIR,
+            out_dir=_DEFAULT_OUT_DIR,
+        )
+    return _Paths(
+        example_root=example_root,
+        data_dir=Path(data) if data else example_root / "data",
+        template_dir=example_root / "templates",
+        out_dir=example_root / "out",
+    )
 
 
 def _normalize_llm_mode(value: str | None) -> str | None:
     if not value:
         return None
     normalized = value.strip().lower()
-    if normalized in {"api", "offline"}:
+    if normalized in _VALID_LLM_MODES:
         return normalized
     return None
 
@@ -166,42 +246,106 @@ def _normalize_llm_mode(value: str | None) -> str | None:
 def _resolve_job_paths(
     job_arg: str | None,
     *,
-    jobs_dir: Path = Path("jobs"),
+    jobs_dir: Path = _JOBS_DIR,
 ) -> tuple[Path | None, ...]:
     if job_arg:
         normalized = job_arg.strip().lower()
         if normalized in {"false", "none", "no"}:
             return (None,)
         return (Path(job_arg),)
-    if jobs_dir.exists():
-        job_paths = sorted(
-            path
-            for path in jobs_dir.glob("*.md")
-            if path.name.lower() != "readme.md"
-        )
-        if job_paths:
-            return tuple(job_paths)
-    return (None,)
+    try:
+        with os.scandir(jobs_dir) as it:
+            names = sorted(
+                entry.name
+                for entry in it
+                if entry.name.endswith(".md") and entry.name.lower() != "readme.md"
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return (None,)
+    return tuple(jobs_dir / name for name in names) or (None,)
 
 
-def _filter_warnings(
+def _report_issues(
     issues: Sequence[LintIssue],
     *,
     debug: bool,
-) -> tuple[LintIssue, ...]:
-    if debug:
-        return tuple(issues)
-    suppressed = {"UNICODE_NON_ASCII"}
-    return tuple(issue for issue in issues if issue.code not in suppressed)
+) -> bool:
+    """Write displayable issues to stderr in one call; return True if any issue is an error."""
+    suppressed = frozenset() if debug else _SUPPRESSED_WARNING_CODES
+    error = Severity.ERROR
+    labels = _SEVERITY_LABELS
+    had_errors = False
+    lines: list[str] = []
+    append = lines.append
+    for issue in issues:
+        severity = issue.severity
+        if severity is error:
+            had_errors = True
+        if issue.code in suppressed:
+            continue
+        where = f" ({issue.source_path})" if issue.source_path else ""
+        append(f"{labels[severity]} {issue.code}: {issue.message}{where}\n")
+    if lines:
+        sys.stderr.write("".join(lines))
+    return had_errors
+
+
+def _write_paths(paths: Sequence[Path]) -> None:
+    if paths:
+        sys.stdout.write("".join(f"{path}\n" for path in paths))
+
+
+def _try_build_cv(request: BuildRequest) -> BuildResult | NotImplementedError:
+    from cv_compiler.pipeline import build_cv
+
+    try:
+        return build_cv(request)
+    except NotImplementedError as e:
+        return e
+
+
+def _has_shared_output_stem(requests: Sequence[BuildRequest]) -> bool:
+    """Return True if two requests would write the same output file."""
+    from cv_compiler.pipeline import job_output_stem
+
+    stems: set[str] = set()
+    for request in requests:
+        try:
+            stem = job_output_stem(request.job_path)
+        except Exception:  # noqa: BLE001
+            # The build reports the broken job; it writes no output file.
+            continue
+        if stem in stems:
+            return True
+        stems.add(stem)
+    return False
+
+
+def _build_in_processes(
+    requests: Sequence[BuildRequest],
+) -> Iterator[BuildResult | NotImplementedError]:
+    """
+    Run independent builds in worker processes, yielding results in request order.
+
+    All requests are submitted up front; each result is yielded as soon as it and its predecessors
+    finish, so the caller can report early jobs while later ones are still building.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_workers = min(len(requests), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(_try_build_cv, requests)
 
 
 def _prompt_llm_mode(env_path: Path) -> str:
+    from cv_compiler.llm.config import upsert_env_value
+
     print(
         "Select LLM mode: [1] api (endpoint)  [2] offline (manual copy/paste)",
         file=sys.stderr,
     )
     choice = input("Enter 1 or 2 [1]: ").strip().lower()
-    mode = "offline" if choice in {"2", "offline", "o"} else "api"
+    mode = "offline" if choice in _OFFLINE_CHOICES else "api"
     try:
         upsert_env_value(env_path, "CV_LLM_MODE", mode)
         print(
@@ -216,9 +360,15 @@ def _prompt_llm_mode(env_path: Path) -> str:
     return mode
 
 
-def _resolve_llm_mode(env_path: Path) -> str:
+def _resolve_llm_mode(env_path: Path, file_values: Mapping[str, str]) -> str:
+    """
+    Resolve the LLM mode from the environment, then `file_values`, then an interactive prompt.
+
+    Handlers call this once and pass the env file values they already read, so no caching is
+    needed; the TTY check only runs when neither source sets a mode.
+    """
     env_value = os.getenv("CV_LLM_MODE")
-    file_value = read_env_file(env_path).get("CV_LLM_MODE")
+    file_value = file_values.get("CV_LLM_MODE")
     mode = _normalize_llm_mode(env_value) or _normalize_llm_mode(file_value)
     if mode:
         return mode
@@ -231,200 +381,54 @@ def _resolve_llm_mode(env_path: Path) -> str:
     return "offline"
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    parser = _build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
-
-    match args.command:
-        case "build":
-            example_root = _resolve_example_root(args.example) if args.example else None
-            data_dir = (
-                Path(args.data)
-                if args.data
-                else (example_root / "data" if example_root else Path("data"))
-            )
-            template_dir = example_root / "templates" if example_root else Path("templates")
-            out_dir = example_root / "out" if example_root else Path("out")
-            render_format = RenderFormat.MARKDOWN if args.no_pdf else RenderFormat.PDF
+def _cmd_build(args: argparse.Namespace) -> int:
+    from cv_compiler.pipeline import BuildRequest, build_cv
+    from cv_compiler.render.types import RenderFormat
 
-            if args.from_markdown:
-                if args.no_pdf:
-                    print("--from-markdown requires PDF output (omit --no-pdf).", file=sys.stderr)
-                    return 2
-                if args.llm or args.job or args.experience_regenerate or args.experience_summary:
-                    print(
-                        "--from-markdown cannot be combined with --llm, --job, or "
-                        "--experience-regenerate, or --experience-summary.",
-                        file=sys.stderr,
-                    )
-                    return 2
-                result = build_cv(
-                    BuildRequest(
-                        data_dir=data_dir,
-                        job_path=None,
-                        template_dir=template_dir,
-                        out_dir=out_dir,
-                        format=RenderFormat.PDF,
-                        llm=None,
-                        llm_instructions_path=None,
-                        render_from_markdown=Path(args.from_markdown),
-                    )
-                )
-                errors = [i for i in result.issues if i.severity == Severity.ERROR]
-                for issue in result.issues:
-                    where = f" ({issue.source_path})" if issue.source_path else ""
-                    print(
-                        f"{issue.severity.value.upper()} {issue.code}: {issue.message}{where}",
-                        file=sys.stderr,
-                    )
-                if errors:
-                    return 1
-                print(result.output_path)
-                return 0
-
-            llm = None
-            if args.llm:
-                if args.llm == "noop":
-                    llm = NoopProvider()
-                elif args.llm == "openai":
-                    env_path = Path("config/llm.env")
-                    mode = _resolve_llm_mode(env_path)
-                    if mode == "api":
-                        config = LLMConfig.from_env(env_path=env_path)
-                        if config is None:
-                            print(
-                                "Missing LLM config. Set CV_LLM_BASE_URL and CV_LLM_MODEL "
-                                "(optional CV_LLM_API_KEY).",
-                                file=sys.stderr,
-                            )
-                            return 2
-                        llm = OpenAIProvider(config)
-                    else:
-                        file_values = read_env_file(env_path)
-                        model = (
-                            os.getenv("CV_LLM_MODEL") or file_values.get("CV_LLM_MODEL") or "manual"
-                        )
-                        base_url = os.getenv("CV_LLM_BASE_URL") or file_values.get(
-                            "CV_LLM_BASE_URL"
-                        )
-                        llm = ManualProvider(
-                            request_path=out_dir / "llm_request.json",
-                            response_path=out_dir / "llm_response.json",
-                            skills_request_path=out_dir / "llm_skills_request.json",
-                            skills_response_path=out_dir / "llm_skills_response.json",
-                            model=model,
-                            base_url=base_url,
-                        )
-                elif args.llm == "codex":
-                    config = CodexExecConfig.from_env(env_path=Path("config/llm.env"))
-                    llm = CodexExecProvider(config)
-                else:
-                    print(
-                        "Unknown/unsupported LLM provider: "
-                        f"{args.llm!r} (supported: openai, noop, codex)",
-                        file=sys.stderr,
-                    )
-                    return 2
+    paths = _resolve_paths(args)
+    render_format = RenderFormat.MARKDOWN if args.no_pdf else RenderFormat.PDF
 
-            job_paths = _resolve_job_paths(args.job)
-            all_outputs: list[Path] = []
-            had_errors = False
-            for job_path in job_paths:
-                try:
-                    result = build_cv(
-                        BuildRequest(
-                            data_dir=data_dir,
-                            job_path=job_path,
-                            template_dir=template_dir,
-                            out_dir=out_dir,
-                            format=render_format,
-                        llm=llm,
-                        llm_instructions_path=None,
-                        experience_regenerate=args.experience_regenerate,
-                        experience_summary=args.experience_summary,
-                    )
-                )
-                except NotImplementedError as e:
-                    print(f"Build failed: {e}", file=sys.stderr)
-                    had_errors = True
-                    continue
-
-                errors = [i for i in result.issues if i.severity == Severity.ERROR]
-                display_issues = _filter_warnings(result.issues, debug=args.debug)
-                for issue in display_issues:
-                    where = f" ({issue.source_path})" if issue.source_path else ""
-                    print(
-                        f"{issue.severity.value.upper()} {issue.code}: {issue.message}{where}",
-                        file=sys.stderr,
-                    )
-                if errors:
-                    had_errors = True
-                    continue
-
-                all_outputs.append(result.output_path)
-
-            for path in all_outputs:
-                print(path)
-            return 1 if had_errors else 0
-        case "lint":
-            example_root = _resolve_example_root(args.example) if args.example else None
-            data_dir = (
-                Path(args.data)
-                if args.data
-                else (example_root / "data" if example_root else Path("data"))
+    if args.from_markdown:
+        if args.no_pdf:
+            print("--from-markdown requires PDF output (omit --no-pdf).", file=sys.stderr)
+            return 2
+        if args.llm or args.job or args.experience_regenerate or args.experience_summary:
+            print(
+                "--from-markdown cannot be combined with --llm, --job, or "
+                "--experience-regenerate, or --experience-summary.",
+                file=sys.stderr,
             )
-
-            try:
-                data = load_canonical_data(data_dir)
-            except Exception as e:  # noqa: BLE001
-                print(f"Failed to load data: {e}", file=sys.stderr)
-                return 1
-
-            issues = lint_build_inputs(data)
-            errors = [i for i in issues if i.severity == Severity.ERROR]
-            display_issues = _filter_warnings(issues, debug=args.debug)
-            for issue in display_issues:
-                where = f" ({issue.source_path})" if issue.source_path else ""
-                print(
-                    f"{issue.severity.value.upper()} {issue.code}: {issue.message}{where}",
-                    file=sys.stderr,
-                )
-            return 1 if errors else 0
-        case "explain":
-            example_root = _resolve_example_root(args.example) if args.example else None
-            data_dir = (
-                Path(args.data)
-                if args.data
-                else (example_root / "data" if example_root else Path("data"))
+            return 2
+        result = build_cv(
+            BuildRequest(
+                data_dir=paths.data_dir,
+                job_path=None,
+                template_dir=paths.template_dir,
+                out_dir=paths.out_dir,
+                format=RenderFormat.PDF,
+                llm=None,
+                llm_instructions_path=None,
+                render_from_markdown=Path(args.from_markdown),
             )
-            job_path = Path(args.job)
-
-            try:
-                data = load_canonical_data(data_dir)
-                job = load_job_spec(job_path)
-            except Exception as e:  # noqa: BLE001
-                print(f"Failed to load inputs: {e}", file=sys.stderr)
-                return 1
-
-            selection = select_content(data, job)
-            print(format_selection_explanation(selection))
-            return 0
-        case "to_mds_from_pdf":
-            data_dir = Path(args.data) if args.data else Path("data")
-            pdf_path = Path(args.pdf) if args.pdf else data_dir / "cv.pdf"
-            if not pdf_path.exists():
-                print(f"PDF not found: {pdf_path}", file=sys.stderr)
-                return 2
-
-            if args.llm != "openai":
-                print(
-                    f"Unsupported LLM provider for ingestion: {args.llm!r} (supported: openai)",
-                    file=sys.stderr,
-                )
-                return 2
-
-            env_path = Path("config/llm.env")
-            mode = _resolve_llm_mode(env_path)
+        )
+        if _report_issues(result.issues, debug=True):
+            return 1
+        print(result.output_path)
+        return 0
+
+    llm = None
+    if args.llm:
+        if args.llm == "noop":
+            from cv_compiler.llm import NoopProvider
+
+            llm = NoopProvider()
+        elif args.llm == "openai":
+            from cv_compiler.llm import LLMConfig, ManualProvider, OpenAIProvider
+            from cv_compiler.llm.config import read_env_file
+
+            env_path = _LLM_ENV_PATH
+            file_values = read_env_file(env_path)
+            mode = _resolve_llm_mode(env_path, file_values)
             if mode == "api":
                 config = LLMConfig.from_env(env_path=env_path)
                 if config is None:
@@ -434,39 +438,179 @@ def main(argv: Sequence[str] | None = None) -> int:
                         file=sys.stderr,
                     )
                     return 2
-                llm_config = config
-                model = config.model
-                base_url = config.base_url
+                llm = OpenAIProvider(config)
             else:
-                file_values = read_env_file(env_path)
-                llm_config = None
-                model = (
-                    os.getenv("CV_LLM_MODEL") or file_values.get("CV_LLM_MODEL") or "manual"
-                )
+                model = os.getenv("CV_LLM_MODEL") or file_values.get("CV_LLM_MODEL") or "manual"
                 base_url = os.getenv("CV_LLM_BASE_URL") or file_values.get("CV_LLM_BASE_URL")
+                llm = ManualProvider(
+                    request_path=paths.out_dir / "llm_request.json",
+                    response_path=paths.out_dir / "llm_response.json",
+                    skills_request_path=paths.out_dir / "llm_skills_request.json",
+                    skills_response_path=paths.out_dir / "llm_skills_response.json",
+                    model=model,
+                    base_url=base_url,
+                )
+        elif args.llm == "codex":
+            from cv_compiler.llm import CodexExecConfig, CodexExecProvider
 
+            config = CodexExecConfig.from_env(env_path=_LLM_ENV_PATH)
             try:
-                result = ingest_pdf_to_markdown(
-                    data_dir=data_dir,
-                    pdf_path=pdf_path,
-                    llm_mode=mode,
-                    llm_config=llm_config,
-                    overwrite=args.overwrite,
-                    request_path=data_dir / "llm_ingest_request.json",
-                    response_path=data_dir / "llm_ingest_response.json",
-                    manual_model=model,
-                    manual_base_url=base_url,
-                )
-            except Exception as exc:  # noqa: BLE001
-                print(f"PDF ingestion failed: {exc}", file=sys.stderr)
-                return 1
-
-            for warning in result.warnings:
-                print(f"WARNING INGEST: {warning}", file=sys.stderr)
-
-            for path in result.written_paths:
-                print(path)
-            return 0
-        case _:
-            parser.error(f"Unknown command: {args.command}")
+                llm = CodexExecProvider(config)
+            except ValueError as exc:
+                print(f"{exc}. Install codex or set CV_CODEX_CMD.", file=sys.stderr)
+                return 2
+            if args.experience_regenerate:
+                # Regenerating means fresh codex answers, not replays of cached ones.
+                llm.clear_cache()
+
+    base_request = BuildRequest(
+        data_dir=paths.data_dir,
+        job_path=None,
+        template_dir=paths.template_dir,
+        out_dir=paths.out_dir,
+        format=render_format,
+        llm=llm,
+        llm_instructions_path=None,
+        experience_regenerate=args.experience_regenerate,
+        experience_summary=args.experience_summary,
+    )
+    requests = [
+        dataclasses.replace(base_request, job_path=job_path)
+        for job_path in _resolve_job_paths(args.job)
+    ]
+    # Deterministic builds only write their own output file, so jobs can run side by side.
+    # LLM providers write shared request/response and experience files; keep those serial, as well
+    # as jobs whose ids share an output file, so the last job in sorted order still wins.
+    if llm is None and len(requests) > 1 and not _has_shared_output_stem(requests):
+        results = _build_in_processes(requests)
+    else:
+        results = map(_try_build_cv, requests)
+
+    all_outputs: list[Path] = []
+    had_errors = False
+    for result in results:
+        if isinstance(result, NotImplementedError):
+            print(f"Build failed: {result}", file=sys.stderr)
+            had_errors = True
+            continue
+
+        if _report_issues(result.issues, debug=args.debug):
+            had_errors = True
+            continue
+
+        all_outputs.append(result.output_path)
+
+    _write_paths(all_outputs)
+    return 1 if had_errors else 0
+
+
+def _cmd_lint(args: argparse.Namespace) -> int:
+    from cv_compiler.lint.linter import lint_build_inputs
+    from cv_compiler.parse.loaders import load_canonical_data
+
+    paths = _resolve_paths(args)
+
+    try:
+        data = load_canonical_data(paths.data_dir)
+    except Exception as e:  # noqa: BLE001
+        print(f"Failed to load data: {e}", file=sys.stderr)
+        return 1
+
+    issues = lint_build_inputs(data)
+    return 1 if _report_issues(issues, debug=args.debug) else 0
+
+
+def _cmd_explain(args: argparse.Namespace) -> int:
+    from cv_compiler.explain import write_selection_explanation
+    from cv_compiler.parse.loaders import load_canonical_data, load_job_spec
+    from cv_compiler.select.selector import select_content
+
+    paths = _resolve_paths(args)
+    job_path = Path(args.job)
+
+    try:
+        data = load_canonical_data(paths.data_dir)
+        job = load_job_spec(job_path)
+    except Exception as e:  # noqa: BLE001
+        print(f"Failed to load inputs: {e}", file=sys.stderr)
+        return 1
+
+    selection = select_content(data, job)
+    write_selection_explanation(selection, sys.stdout)
+    return 0
+
+
+def _cmd_ingest(args: argparse.Namespace) -> int:
+    paths = _resolve_paths(args)
+    pdf_path = Path(args.pdf) if args.pdf else paths.data_dir / "cv.pdf"
+    if not pdf_path.exists():
+        print(f"PDF not found: {pdf_path}", file=sys.stderr)
+        return 2
+
+    from cv_compiler.ingest import ingest_pdf_to_markdown
+    from cv_compiler.llm import LLMConfig
+    from cv_compiler.llm.config import read_env_file
+
+    env_path = _LLM_ENV_PATH
+    file_values = read_env_file(env_path)
+    mode = _resolve_llm_mode(env_path, file_values)
+    if mode == "api":
+        config = LLMConfig.from_env(env_path=env_path)
+        if config is None:
+            print(
+                "Missing LLM config. Set CV_LLM_BASE_URL and CV_LLM_MODEL "
+                "(optional CV_LLM_API_KEY).",
+                file=sys.stderr,
+            )
             return 2
+        llm_config = config
+        model = config.model
+        base_url = config.base_url
+    else:
+        llm_config = None
+        model = os.getenv("CV_LLM_MODEL") or file_values.get("CV_LLM_MODEL") or "manual"
+        base_url = os.getenv("CV_LLM_BASE_URL") or file_values.get("CV_LLM_BASE_URL")
+
+    try:
+        result = ingest_pdf_to_markdown(
+            data_dir=paths.data_dir,
+            pdf_path=pdf_path,
+            llm_mode=mode,
+            llm_config=llm_config,
+            overwrite=args.overwrite,
+            request_path=paths.data_dir / "llm_ingest_request.json",
+            response_path=paths.data_dir / "llm_ingest_response.json",
+            manual_model=model,
+            manual_base_url=base_url,
+            max_pages=args.max_pages,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"PDF ingestion failed: {exc}", file=sys.stderr)
+        return 1
+
+    for warning in result.warnings:
+        print(f"WARNING INGEST: {warning}", file=sys.stderr)
+
+    _write_paths(result.written_paths)
+    return 0
+
+
+_COMMAND_HANDLERS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "build": _cmd_build,
+    "lint": _cmd_lint,
+    "explain": _cmd_explain,
+    "to_mds_from_pdf": _cmd_ingest,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    if argv[:1] == ["--version"] or argv[:1] == ["-V"]:
+        # Answer without building any parser; `--help` still needs the full parser tree.
+        sys.stdout.write(f"cv {__version__}\n")
+        return 0
+    parser = _build_parser(_sniff_subcommand(argv))
+    args = parser.parse_args(argv)
+
+    # `required=True` subparsers guarantee `args.command` is one of the handler keys.
+    return _COMMAND_HANDLERS[args.command](args)
@@ -2,29 +2,38 @@
 Formatting helpers for selection explanations.
 
 Used by `cv explain` to turn structured selection results into a human-readable report.
-Implementation is scaffolded and will be filled in alongside selection logic.
 """
 
 from __future__ import annotations
 
+import io
+from operator import attrgetter
+from typing import TextIO
+
 from cv_compiler.select.types import SelectionResult
 
 
 def format_selection_explanation(selection: SelectionResult) -> str:
     """Format a human-readable explanation for `cv explain`."""
-    selected_exp = set(selection.selected_experience_ids)
-    selected_proj = set(selection.selected_project_ids)
-
-    lines: list[str] = []
-    lines.append("Selection decisions:")
-    lines.append("")
-    for decision in sorted(selection.decisions, key=lambda d: (-d.score, d.item_id)):
-        included = decision.item_id in selected_exp or decision.item_id in selected_proj
-        flag = "IN" if included else "OUT"
-        matched = ", ".join(decision.matched_keywords) if decision.matched_keywords else "-"
-        reasons = ", ".join(decision.reasons) if decision.reasons else "-"
-        lines.append(
-            f"- {flag} {decision.item_id} score={decision.score:.3f} matched=[{matched}] {reasons}"
-        )
-    lines.append("")
-    return "\n".join(lines)
+    buffer = io.StringIO()
+    write_selection_explanation(selection, buffer)
+    # The streamed form ends with the newline `print()` would add; the string form does not.
+    return buffer.getvalue().removesuffix("\n")
+
+
+def write_selection_explanation(selection: SelectionResult, out: TextIO) -> None:
+    """Write the `cv explain` report to `out` line by line instead of building one string."""
+    selected = {*selection.selected_experience_ids, *selection.selected_project_ids}
+    # Two stable sorts on C-level keys order by (-score, item_id) without building a tuple per item.
+    decisions = sorted(selection.decisions, key=attrgetter("item_id"))
+    decisions.sort(key=attrgetter("score"), reverse=True)
+
+    write = out.write
+    write("Selection decisions:\n\n")
+    for decision in decisions:
+        flag = "IN" if decision.item_id in selected else "OUT"
+        matched = ", ".join(decision.matched_keywords) or "-"
+        reasons = ", ".join(decision.reasons) or "-"
+        write(f"- {flag} {decision.item_id} score={decision.score:.3f} ")
+        write(f"matched=[{matched}] {reasons}\n")
+    write("\n")
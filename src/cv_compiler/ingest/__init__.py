@@ -1,9 +1,26 @@
 """
 Ingestion helpers for bootstrapping canonical data.
+
+`pdf_ingest` depends on the YAML, HTTP, and LLM modules, so its names are exported lazily and
+importing `cv_compiler.ingest` (or a sibling submodule) does not load them.
 """
 
 from __future__ import annotations
 
-from .pdf_ingest import IngestResult, ingest_pdf_to_markdown
+from typing import TYPE_CHECKING
+
+from cv_compiler.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .pdf_ingest import IngestResult, ingest_pdf_to_markdown
 
 __all__ = ["IngestResult", "ingest_pdf_to_markdown"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "IngestResult": ".pdf_ingest",
+        "ingest_pdf_to_markdown": ".pdf_ingest",
+    },
+)
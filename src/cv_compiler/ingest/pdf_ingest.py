@@ -6,23 +6,40 @@ Extracts machine-readable text, uses an LLM to structure it, and writes `.md` fi
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
 import re
 import shutil
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Any
-from urllib.request import Request, urlopen
+from typing import Any, TypeVar
 
 import yaml
 
+from cv_compiler.cache import write_cache_text
 from cv_compiler.llm.config import LLMConfig
-from cv_compiler.llm.openai import build_chat_endpoint, build_chat_payload, extract_chat_content
+from cv_compiler.llm.openai import (
+    build_chat_endpoint,
+    build_chat_payload,
+    extract_chat_content,
+    request_chat_completion,
+)
+from cv_compiler.llm.prompts import read_prompt_text
+from cv_compiler.yaml_compat import YamlDumper
 
 _SAFE_ID_RE = re.compile(r"[^a-z0-9_]+")
+_SLUG_SAFE = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789_")
+_SLUG_BYTES = bytes(byte if byte in _SLUG_SAFE else ord(" ") for byte in range(256))
 _MIN_TEXT_CHARS = 200
 _PLACEHOLDER = "TODO: edit this field"
+_LLM_CACHE_DIR = Path(".cache") / "cv-compiler" / "llm_ingest"
+
+_RecordT = TypeVar("_RecordT")
 
 
 @dataclass(frozen=True, slots=True)
@@ -93,27 +110,70 @@ class IngestResult:
     warnings: tuple[str, ...]
 
 
-def extract_pdf_text(path: Path) -> str:
-    """Extract text from a machine-readable PDF or raise if none is found."""
+def extract_pdf_text(path: Path, *, max_pages: int | None = None) -> str:
+    """
+    Extract text from a machine-readable PDF or raise if none is found.
+
+    PDFs with more than `max_pages` pages are rejected before any page is decoded.
+    """
     try:
         from pypdf import PdfReader
     except ImportError as exc:  # pragma: no cover - dependency guard
         raise RuntimeError("pypdf is required for PDF ingestion. Run `uv sync`.") from exc
-    reader = PdfReader(str(path))
     chunks: list[str] = []
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        if text.strip():
-            chunks.append(text)
+    skipped_pages = 0
+    # Given a path, PdfReader copies the whole file into a BytesIO; reading through a map lets
+    # it pull only the objects it touches from the page cache.
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError(f"PDF file is empty: {path}")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            pages = PdfReader(view).pages
+            if max_pages is not None and len(pages) > max_pages:
+                raise ValueError(
+                    f"PDF has {len(pages)} pages; at most {max_pages} are ingested. "
+                    "Pass a higher --max-pages if this really is one CV."
+                )
+            for page in pages:
+                if not _page_may_have_text(page):
+                    skipped_pages += 1
+                    continue
+                text = page.extract_text() or ""
+                if text.strip():
+                    chunks.append(text)
     combined = "\n".join(chunks).strip()
-    if len(re.sub(r"\s+", "", combined)) < _MIN_TEXT_CHARS:
+    # Non-whitespace character count; str.split() uses the same whitespace class as regex `\s`.
+    if sum(map(len, combined.split())) < _MIN_TEXT_CHARS:
+        scanned = f" ({skipped_pages} page(s) have no fonts)" if skipped_pages else ""
         raise ValueError(
-            "PDF contains too little extractable text; it may be scanned. "
+            f"PDF contains too little extractable text; it may be scanned{scanned}. "
             "Run OCR or provide a machine-readable PDF."
         )
     return combined
 
 
+def _page_may_have_text(page: Any) -> bool:
+    """
+    Cheap resource probe run before `extract_text()` decodes the content stream.
+
+    Text needs a font, either in the page resources or in a form XObject the page draws, so a page
+    whose resources have neither (e.g. a scanned image) cannot yield text.
+    """
+    resources = page.get("/Resources")
+    if resources is None:
+        return True
+    resources = resources.get_object()
+    if "/Font" in resources:
+        return True
+    xobjects = resources.get("/XObject")
+    if xobjects is None:
+        return False
+    return any(
+        xobject.get_object().get("/Subtype") == "/Form"
+        for xobject in xobjects.get_object().values()
+    )
+
+
 def ingest_pdf_to_markdown(
     *,
     data_dir: Path,
@@ -126,29 +186,30 @@ def ingest_pdf_to_markdown(
     response_path: Path | None = None,
     manual_model: str = "manual",
     manual_base_url: str | None = None,
+    max_pages: int | None = None,
 ) -> IngestResult:
     """Convert a PDF CV into canonical Markdown files under `data_dir`."""
-    text = extract_pdf_text(pdf_path)
+    text = extract_pdf_text(pdf_path, max_pages=max_pages)
     prompt = _build_ingest_prompt(prompt_path, text)
 
-    payload = build_chat_payload(manual_model, prompt, _ingest_schema())
     if llm_mode == "api":
         if llm_config is None:
             raise ValueError("Missing LLM config for API mode")
-        content = _request_llm_content(llm_config, prompt)
+        cache_dir = _LLM_CACHE_DIR if os.getenv("CV_LLM_CACHE") == "1" else None
+        parsed = _request_llm_cv(llm_config, prompt, cache_dir=cache_dir)
     elif llm_mode == "offline":
         if request_path is None or response_path is None:
             raise ValueError("Offline mode requires request/response paths")
         content = _manual_llm_content(
-            payload=payload,
+            payload=build_chat_payload(manual_model, prompt, _ingest_schema()),
             request_path=request_path,
             response_path=response_path,
             base_url=manual_base_url,
         )
+        parsed = parse_ingest_response(content)
     else:
         raise ValueError(f"Unknown LLM mode: {llm_mode}")
 
-    parsed = parse_ingest_response(content)
     return write_ingest_files(data_dir, parsed, overwrite=overwrite)
 
 
@@ -168,7 +229,7 @@ def parse_ingest_payload(payload: object) -> ParsedCv:
     if not isinstance(profile_raw, dict):
         raise ValueError("Missing or invalid profile section")
 
-    links = _parse_links(profile_raw.get("links"))
+    links = _parse_records(profile_raw.get("links"), ParsedLink, ("label", "url"))
     profile = ParsedProfile(
         name=_coerce_str(profile_raw.get("name")),
         headline=_coerce_str(profile_raw.get("headline")),
@@ -178,10 +239,24 @@ def parse_ingest_payload(payload: object) -> ParsedCv:
         links=links,
     )
 
-    experience = _parse_experience(payload.get("experience"))
-    projects = _parse_projects(payload.get("projects"))
-    skills = _parse_skills(payload.get("skills"))
-    education = _parse_education(payload.get("education"))
+    experience = _parse_records(
+        payload.get("experience"),
+        ParsedExperience,
+        ("company", "title", "location", "start_date", "end_date"),
+        ("bullets", "tags"),
+    )
+    projects = _parse_records(
+        payload.get("projects"),
+        ParsedProject,
+        ("name", "company", "role", "start_date", "end_date"),
+        ("bullets", "tags"),
+    )
+    skills = _parse_records(payload.get("skills"), ParsedSkillCategory, ("name",), ("items",))
+    education = _parse_records(
+        payload.get("education"),
+        ParsedEducation,
+        ("institution", "degree", "location", "start_date", "end_date"),
+    )
 
     return ParsedCv(
         profile=profile,
@@ -200,6 +275,7 @@ def write_ingest_files(data_dir: Path, parsed: ParsedCv, *, overwrite: bool) ->
 
     try:
         used_ids: set[str] = {"profile", "skills", "education"}
+        next_suffix: dict[str, int] = {}
 
         profile_path = data_dir / "profile.md"
         _ensure_writable(profile_path, overwrite=False)
@@ -229,7 +305,7 @@ def write_ingest_files(data_dir: Path, parsed: ParsedCv, *, overwrite: bool) ->
             "categories": [
                 {
                     "name": _require_field(cat.name, "skills.category.name", warnings),
-                    "items": list(cat.items),
+                    "items": cat.items,
                 }
                 for cat in parsed.skills
             ],
@@ -281,7 +357,7 @@ def write_ingest_files(data_dir: Path, parsed: ParsedCv, *, overwrite: bool) ->
         projects_dir.mkdir(parents=True, exist_ok=True)
         project_entries = list(parsed.projects) + derived_projects
         for idx, entry in enumerate(project_entries, start=1):
-            proj_id = _unique_id(_slugify(f"proj_{entry.name or idx}"), used_ids)
+            proj_id = _unique_id(_slugify(f"proj_{entry.name or idx}"), used_ids, next_suffix)
             used_ids.add(proj_id)
             proj_path = projects_dir / f"{proj_id}.md"
             _ensure_writable(proj_path, overwrite=False)
@@ -292,8 +368,8 @@ def write_ingest_files(data_dir: Path, parsed: ParsedCv, *, overwrite: bool) ->
                 "role": entry.role,
                 "start_date": entry.start_date,
                 "end_date": entry.end_date,
-                "tags": list(entry.tags),
-                "bullets": list(entry.bullets),
+                "tags": entry.tags,
+                "bullets": entry.bullets,
             }
             _write_frontmatter(proj_path, proj_frontmatter, note="Generated from PDF.")
             written.append(proj_path)
@@ -310,25 +386,30 @@ def write_ingest_files(data_dir: Path, parsed: ParsedCv, *, overwrite: bool) ->
 
 
 def _build_ingest_prompt(path: Path, pdf_text: str) -> str:
-    prompt = path.read_text(encoding="utf-8")
+    prompt = read_prompt_text(path)
     return prompt.replace("{{PDF_TEXT}}", pdf_text.strip())
 
 
-def _request_llm_content(config: LLMConfig, prompt: str) -> str:
-    url = build_chat_endpoint(config.base_url)
-    payload = build_chat_payload(config.model, prompt, _ingest_schema())
-    data = json.dumps(payload).encode("utf-8")
-    headers = {"Content-Type": "application/json"}
-    if config.api_key:
-        headers["Authorization"] = f"Bearer {config.api_key}"
-    req = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(req, timeout=config.timeout_seconds) as resp:  # noqa: S310
-        body = resp.read().decode("utf-8")
-    parsed = json.loads(body)
-    content = extract_chat_content(parsed)
-    if content is None:
-        raise ValueError("Unexpected LLM response shape")
-    return content
+def _request_llm_cv(config: LLMConfig, prompt: str, *, cache_dir: Path | None = None) -> ParsedCv:
+    """Request and parse the ingest response; only responses that parse are cached."""
+    schema = _ingest_schema()
+    if cache_dir is None:
+        return parse_ingest_response(
+            request_chat_completion(config, prompt, response_format=schema)
+        )
+    key_source = json.dumps({"m": config.model, "p": prompt, "s": schema}, sort_keys=True)
+    cache_path = cache_dir / f"{hashlib.sha256(key_source.encode('utf-8')).hexdigest()}.json"
+    try:
+        return parse_ingest_response(cache_path.read_text(encoding="utf-8"))
+    except OSError:
+        pass
+    except ValueError:
+        # Only parsed responses are written, so this entry is stale or hand-edited.
+        cache_path.unlink(missing_ok=True)
+    content = request_chat_completion(config, prompt, response_format=schema)
+    parsed = parse_ingest_response(content)
+    write_cache_text(cache_path, content)
+    return parsed
 
 
 def _manual_llm_content(
@@ -356,106 +437,32 @@ def _manual_llm_content(
         parsed = json.loads(raw)
     except json.JSONDecodeError:
         return raw
+    if not isinstance(parsed, dict):
+        return raw
+    # Full chat completion first, then a bare {"content": ...}; anything else is the payload.
     content = extract_chat_content(parsed)
-    if content is not None:
-        return content
-    direct = parsed.get("content") if isinstance(parsed, dict) else None
-    if isinstance(direct, str):
-        return direct
-    return raw
-
-
-def _parse_links(value: object) -> tuple[ParsedLink, ...]:
-    if not isinstance(value, list):
-        return ()
-    links: list[ParsedLink] = []
-    for item in value:
-        if not isinstance(item, dict):
-            continue
-        links.append(
-            ParsedLink(
-                label=_coerce_str(item.get("label")),
-                url=_coerce_str(item.get("url")),
-            )
-        )
-    return tuple(links)
-
-
-def _parse_experience(value: object) -> tuple[ParsedExperience, ...]:
-    if not isinstance(value, list):
-        return ()
-    items: list[ParsedExperience] = []
-    for item in value:
-        if not isinstance(item, dict):
-            continue
-        items.append(
-            ParsedExperience(
-                company=_coerce_str(item.get("company")),
-                title=_coerce_str(item.get("title")),
-                location=_coerce_str(item.get("location")),
-                start_date=_coerce_str(item.get("start_date")),
-                end_date=_coerce_str(item.get("end_date")),
-                bullets=_coerce_str_list(item.get("bullets")),
-                tags=_coerce_str_list(item.get("tags")),
-            )
-        )
-    return tuple(items)
-
-
-def _parse_projects(value: object) -> tuple[ParsedProject, ...]:
-    if not isinstance(value, list):
-        return ()
-    items: list[ParsedProject] = []
-    for item in value:
-        if not isinstance(item, dict):
-            continue
-        items.append(
-            ParsedProject(
-                name=_coerce_str(item.get("name")),
-                company=_coerce_str(item.get("company")),
-                role=_coerce_str(item.get("role")),
-                start_date=_coerce_str(item.get("start_date")),
-                end_date=_coerce_str(item.get("end_date")),
-                bullets=_coerce_str_list(item.get("bullets")),
-                tags=_coerce_str_list(item.get("tags")),
-            )
-        )
-    return tuple(items)
-
-
-def _parse_skills(value: object) -> tuple[ParsedSkillCategory, ...]:
-    if not isinstance(value, list):
-        return ()
-    items: list[ParsedSkillCategory] = []
-    for item in value:
-        if not isinstance(item, dict):
-            continue
-        items.append(
-            ParsedSkillCategory(
-                name=_coerce_str(item.get("name")),
-                items=_coerce_str_list(item.get("items")),
-            )
-        )
-    return tuple(items)
+    if content is None:
+        content = parsed.get("content")
+    return content if isinstance(content, str) else raw
 
 
-def _parse_education(value: object) -> tuple[ParsedEducation, ...]:
+def _parse_records(
+    value: object,
+    factory: Callable[..., _RecordT],
+    text_fields: tuple[str, ...],
+    list_fields: tuple[str, ...] = (),
+) -> tuple[_RecordT, ...]:
+    """Build one record per dict in `value`, coercing each named field; other items are ignored."""
     if not isinstance(value, list):
         return ()
-    items: list[ParsedEducation] = []
-    for item in value:
-        if not isinstance(item, dict):
-            continue
-        items.append(
-            ParsedEducation(
-                institution=_coerce_str(item.get("institution")),
-                degree=_coerce_str(item.get("degree")),
-                location=_coerce_str(item.get("location")),
-                start_date=_coerce_str(item.get("start_date")),
-                end_date=_coerce_str(item.get("end_date")),
-            )
+    return tuple(
+        factory(
+            **{field: _coerce_str(item.get(field)) for field in text_fields},
+            **{field: _coerce_str_list(item.get(field)) for field in list_fields},
         )
-    return tuple(items)
+        for item in value
+        if isinstance(item, dict)
+    )
 
 
 def _coerce_str(value: object) -> str | None:
@@ -486,12 +493,12 @@ def _require_field(value: str | None, field: str, warnings: list[str]) -> str:
 
 
 def _write_frontmatter(path: Path, frontmatter: dict[str, Any], note: str) -> None:
-    content = "---\n"
-    content += yaml.safe_dump(frontmatter, sort_keys=False).strip()
-    content += "\n---\n\n"
-    content += "Notes (not rendered):\n"
-    content += f"- {note}\n"
-    path.write_text(content, encoding="utf-8")
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("---\n")
+        # YamlDumper (libyaml CSafeDumper or SafeDumper) ends the document with a newline, so the
+        # closing fence follows directly.
+        yaml.dump(frontmatter, handle, Dumper=YamlDumper, sort_keys=False)
+        handle.write(f"---\n\nNotes (not rendered):\n- {note}\n")
 
 
 def _collect_ingest_files(data_dir: Path) -> tuple[Path, ...]:
@@ -552,20 +559,31 @@ def _ensure_writable(path: Path, *, overwrite: bool) -> None:
 
 
 def _slugify(text: str) -> str:
-    slug = _SAFE_ID_RE.sub("_", text.strip().lower()).strip("_")
+    lowered = text.lower()
+    if lowered.isascii():
+        # Map every unsafe byte to a space, then let split() collapse the runs that the regex
+        # would have replaced with a single underscore.
+        spaced = lowered.encode("ascii").translate(_SLUG_BYTES).decode("ascii")
+        slug = "_".join(spaced.split()).strip("_")
+    else:
+        slug = _SAFE_ID_RE.sub("_", lowered).strip("_")
     return slug or "item"
 
 
-def _unique_id(base: str, used: set[str]) -> str:
+def _unique_id(base: str, used: set[str], next_suffix: dict[str, int]) -> str:
+    # Resume from the last suffix handed out for `base` instead of rescanning from `_2`.
     candidate = base
-    counter = 2
+    counter = next_suffix.get(base, 2)
     while candidate in used:
         candidate = f"{base}_{counter}"
         counter += 1
+    next_suffix[base] = counter
     return candidate
 
 
+@cache
 def _ingest_schema() -> dict[str, object]:
+    # Built once and shared; callers only serialize it, so it must never be mutated.
     return {
         "type": "json_schema",
         "json_schema": {
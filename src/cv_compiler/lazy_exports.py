@@ -0,0 +1,39 @@
+"""
+Lazy package re-exports.
+
+Packages whose submodules pull in heavy dependencies list their public names in a name -> module
+map and resolve them on first attribute access (PEP 562), so importing the package or a light
+sibling submodule stays cheap.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict[str, Any],
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level `__getattr__` and `__dir__` for `package`.
+
+    `exports` maps each public name to the relative module that defines it; `namespace` is the
+    package's `globals()`, where resolved names are stored so later lookups skip `__getattr__`.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
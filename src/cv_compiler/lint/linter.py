@@ -61,17 +61,17 @@ def lint_build_inputs(data: CanonicalData) -> Sequence[LintIssue]:
                     source_path=source_path,
                 )
             )
-        for ch in text:
-            if ord(ch) > 127:
-                issues.append(
-                    LintIssue(
-                        code="UNICODE_NON_ASCII",
-                        message=f"Non-ASCII character {ch!r} in {field} (ATS risk)",
-                        severity=Severity.WARNING,
-                        source_path=source_path,
-                    )
+        if not text.isascii():
+            # The C-level isascii() check clears the common case; only offenders get scanned.
+            ch = next(c for c in text if ord(c) > 127)
+            issues.append(
+                LintIssue(
+                    code="UNICODE_NON_ASCII",
+                    message=f"Non-ASCII character {ch!r} in {field} (ATS risk)",
+                    severity=Severity.WARNING,
+                    source_path=source_path,
                 )
-                break
+            )
 
     lint_text(data.profile.about_me, source_path=data.profile.source_path, field="profile.about_me")
 
@@ -6,17 +6,23 @@ Runs `codex exec` to produce structured experience drafts and skill highlights.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
 
+from cv_compiler.cache import file_stamp, write_cache_text
 from cv_compiler.llm.base import (
     BulletRewriteRequest,
     BulletRewriteResult,
@@ -33,6 +39,18 @@ from cv_compiler.llm.skills import build_skills_prompt, parse_skill_highlights
 from cv_compiler.llm.summary import build_experience_summary_prompt, parse_experience_summary
 from cv_compiler.schema.models import JobSpec, Profile, ProjectEntry
 
+# The pipeline issues at most three independent codex runs per build (experience, skills, summary).
+_DEFAULT_MAX_PARALLEL = 3
+_CACHE_DIR = Path(".cache") / "cv-compiler" / "codex"
+_SPINNER_INTERVAL_SECONDS = 0.5
+# Overlapping runs share one stderr line; only the run holding this lock draws the spinner.
+_SPINNER_LOCK = threading.Lock()
+_JSON_DECODER = json.JSONDecoder()
+_EXEC_MODE_FLAGS = frozenset({"--full-auto", "--dangerously-bypass-approvals-and-sandbox"})
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+_ResultT = TypeVar("_ResultT")
+
 
 @dataclass(frozen=True, slots=True)
 class CodexExecConfig:
@@ -42,40 +60,71 @@ class CodexExecConfig:
     timeout_seconds: int
     prompt_mode: str
     progress: bool
+    max_parallel: int
+    cache_dir: Path | None = None
+    cache_ttl_seconds: int | None = None
 
     @staticmethod
     def from_env(
         *,
         env_path: Path | None = Path("config/llm.env"),
     ) -> CodexExecConfig:
-        file_values = read_env_file(env_path) if env_path else {}
-        command = os.getenv("CV_CODEX_CMD") or file_values.get("CV_CODEX_CMD") or "codex"
-        args_raw = os.getenv("CV_CODEX_ARGS") or file_values.get("CV_CODEX_ARGS") or ""
-        args = tuple(shlex.split(args_raw))
-        model = (
-            os.getenv("CV_CODEX_MODEL")
-            or file_values.get("CV_CODEX_MODEL")
-            or "gpt-5.2"
-        )
-        timeout_raw = os.getenv("CV_CODEX_TIMEOUT_SECONDS") or file_values.get(
-            "CV_CODEX_TIMEOUT_SECONDS"
-        )
-        prompt_mode = (
-            os.getenv("CV_CODEX_PROMPT_MODE") or file_values.get("CV_CODEX_PROMPT_MODE") or "stdin"
-        )
-        if prompt_mode not in {"stdin", "arg"}:
-            prompt_mode = "stdin"
-        progress_raw = os.getenv("CV_CODEX_PROGRESS") or file_values.get("CV_CODEX_PROGRESS")
-        progress = _parse_bool(progress_raw)
-        timeout = _parse_timeout(timeout_raw) if timeout_raw else 600
-        return CodexExecConfig(
-            command=command,
-            args=args,
-            model=model,
-            timeout_seconds=timeout,
-            prompt_mode=prompt_mode,
-            progress=progress,
-        )
+        env_values = tuple(os.getenv(key) for key in _CODEX_ENV_KEYS)
+        return _codex_config_from_env(env_path, file_stamp(env_path), env_values)
+
+
+_CODEX_ENV_KEYS = (
+    "CV_CODEX_CMD",
+    "CV_CODEX_ARGS",
+    "CV_CODEX_MODEL",
+    "CV_CODEX_TIMEOUT_SECONDS",
+    "CV_CODEX_PROMPT_MODE",
+    "CV_CODEX_PROGRESS",
+    "CV_CODEX_MAX_PARALLEL",
+    "CV_CODEX_CACHE",
+    "CV_CODEX_CACHE_TTL",
+)
+
+
+@lru_cache(maxsize=4)
+def _codex_config_from_env(
+    env_path: Path | None,
+    stamp: tuple[int, int] | None,
+    env_values: tuple[str | None, ...],
+) -> CodexExecConfig:
+    # Memoized like `LLMConfig.from_env` (see `_llm_config_from_env`).
+    file_values = read_env_file(env_path) if env_path else {}
+    (
+        command,
+        args_raw,
+        model,
+        timeout_raw,
+        prompt_mode,
+        progress_raw,
+        max_parallel_raw,
+        cache_raw,
+        ttl_raw,
+    ) = (
+        value or file_values.get(key)
+        for key, value in zip(_CODEX_ENV_KEYS, env_values, strict=True)
+    )
+    if prompt_mode not in {"stdin", "arg"}:
+        prompt_mode = "stdin"
+    timeout = _parse_timeout(timeout_raw) if timeout_raw else 600
+    max_parallel = (
+        _parse_max_parallel(max_parallel_raw) if max_parallel_raw else _DEFAULT_MAX_PARALLEL
+    )
+    return CodexExecConfig(
+        command=command or "codex",
+        args=_split_args(args_raw or ""),
+        model=model or "gpt-5.2",
+        timeout_seconds=timeout,
+        prompt_mode=prompt_mode,
+        progress=_parse_bool(progress_raw),
+        max_parallel=max_parallel,
+        cache_dir=_CACHE_DIR if _parse_bool(cache_raw) else None,
+        cache_ttl_seconds=_parse_cache_ttl(ttl_raw) if ttl_raw else None,
+    )
 
 
 class CodexExecProvider(LLMProvider):
@@ -89,10 +138,21 @@ class CodexExecProvider(LLMProvider):
         templates_path: Path = Path("prompts/experience_templates.yaml"),
         skills_prompt_path: Path = Path("prompts/skills_highlight_prompt.md"),
     ) -> None:
+        # Resolve PATH once: a missing binary fails here instead of after each run's setup, and
+        # every exec skips the PATH search.
+        resolved_command = shutil.which(config.command)
+        if resolved_command is None:
+            raise ValueError(f"codex exec failed: command not found ({config.command})")
         self._config = config
+        self._command = resolved_command
         self._prompt_path = prompt_path
         self._templates_path = templates_path
         self._skills_prompt_path = skills_prompt_path
+        max_parallel = config.max_parallel
+        if _get_output_last_message(list(config.args)) != Path():
+            # Every run would write the same user-supplied --output-last-message file.
+            max_parallel = 1
+        self._slots = threading.BoundedSemaphore(max_parallel)
 
     def rewrite_bullets(
         self,
@@ -114,8 +174,7 @@ class CodexExecProvider(LLMProvider):
             projects=tuple(projects),
             job=job,
         )
-        output = self._run_codex(prompt)
-        return parse_experience_drafts(output)
+        return self._run_codex(prompt, parse_experience_drafts)
 
     def highlight_skills(
         self,
@@ -129,9 +188,12 @@ class CodexExecProvider(LLMProvider):
             profile=profile,
             job=job,
         )
-        output = self._run_codex(prompt)
-        payload = _extract_json_payload(output)
-        return parse_skill_highlights(payload, allowed_skills=tuple(skills))
+        return self._run_codex(
+            prompt,
+            lambda output: parse_skill_highlights(
+                _extract_json_payload(output), allowed_skills=tuple(skills)
+            ),
+        )
 
     def generate_experience_summary(
         self,
@@ -143,21 +205,67 @@ class CodexExecProvider(LLMProvider):
             projects=tuple(projects),
             job=job,
         )
-        output = self._run_codex(prompt)
-        payload = _extract_json_payload(output)
-        return parse_experience_summary(payload)
+        return self._run_codex(
+            prompt, lambda output: parse_experience_summary(_extract_json_payload(output))
+        )
 
-    def _run_codex(self, prompt: str) -> str:
+    def clear_cache(self) -> int:
+        """Delete cached codex outputs and return how many were removed."""
+        if self._config.cache_dir is None or not self._config.cache_dir.is_dir():
+            return 0
+        removed = 0
+        for path in self._config.cache_dir.glob("*.txt"):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
+
+    def _run_codex(self, prompt: str, parse: Callable[[str], _ResultT]) -> _ResultT:
+        """Run codex on `prompt` and parse the answer; only answers that parse are cached."""
+        cache_path = self._cache_path(prompt)
+        if cache_path is not None:
+            cached = _read_cached_output(cache_path, ttl_seconds=self._config.cache_ttl_seconds)
+            if cached is not None:
+                try:
+                    return parse(cached)
+                except Exception:  # noqa: BLE001
+                    # Only parsed answers are written, so this entry is stale or hand-edited.
+                    cache_path.unlink(missing_ok=True)
+        # The pipeline may call several provider methods from worker threads at once.
+        with self._slots:
+            output = self._exec_codex(prompt)
+        result = parse(output)
+        if cache_path is not None:
+            write_cache_text(cache_path, output)
+        return result
+
+    def _cache_path(self, prompt: str) -> Path | None:
+        if self._config.cache_dir is None:
+            return None
+        key_source = "\0".join(
+            (self._config.command, self._config.model or "", *self._config.args, prompt)
+        )
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        return self._config.cache_dir / f"{key}.txt"
+
+    def _exec_codex(self, prompt: str) -> str:
         exec_args = _ensure_full_auto(self._config.args)
-        exec_args, use_json, last_message_path, cleanup = _prepare_json_exec(
+        exec_args, last_message_path, cleanup = _prepare_exec(
             exec_args,
             enable_progress=self._config.progress,
         )
-        cmd = [self._config.command, "exec", *exec_args]
+        # `self._command` is an absolute path and no fds are inherited (Python opens them
+        # non-inheritable), which with close_fds=False lets CPython launch codex via posix_spawn
+        # instead of fork+exec.
+        cmd = [self._command, "exec", *exec_args]
         if self._config.model:
             cmd.extend(["--model", self._config.model])
         try:
-            if use_json and self._config.progress:
+            # The answer always comes from --output-last-message, so stdout (log lines or --json
+            # events) is discarded rather than buffered and searched.
+            if self._config.progress:
                 result = _run_codex_with_spinner(
                     cmd,
                     prompt=prompt,
@@ -167,8 +275,10 @@ class CodexExecProvider(LLMProvider):
             elif self._config.prompt_mode == "arg":
                 result = subprocess.run(
                     cmd + [prompt],
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
+                    close_fds=False,
                     timeout=self._config.timeout_seconds,
                     check=False,
                 )
@@ -176,21 +286,22 @@ class CodexExecProvider(LLMProvider):
                 result = subprocess.run(
                     cmd,
                     input=prompt,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
+                    close_fds=False,
                     timeout=self._config.timeout_seconds,
                     check=False,
                 )
+            if result.returncode != 0:
+                stderr = (result.stderr or "").strip()
+                raise ValueError(f"codex exec failed: {stderr or 'unknown error'}")
+            output = _read_last_message(last_message_path)
         except FileNotFoundError as exc:
             raise ValueError(
                 f"codex exec failed: command not found ({self._config.command})"
             ) from exc
-        if result.returncode != 0:
-            stderr = (result.stderr or "").strip()
-            raise ValueError(f"codex exec failed: {stderr or 'unknown error'}")
-        output = (result.stdout or "").strip()
-        if use_json:
-            output = _read_last_message(last_message_path)
+        finally:
             if cleanup:
                 try:
                     last_message_path.unlink()
@@ -209,25 +320,51 @@ def _parse_timeout(raw: str) -> int:
     return value if value > 0 else 300
 
 
+def _parse_max_parallel(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        return _DEFAULT_MAX_PARALLEL
+    return value if value > 0 else _DEFAULT_MAX_PARALLEL
+
+
+def _parse_cache_ttl(raw: str) -> int | None:
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _read_cached_output(path: Path, *, ttl_seconds: int | None) -> str | None:
+    try:
+        if ttl_seconds is not None and time.time() - path.stat().st_mtime > ttl_seconds:
+            return None
+        output = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    return output or None
+
+
+@lru_cache(maxsize=16)
+def _split_args(raw: str) -> tuple[str, ...]:
+    # shlex is a pure-Python tokenizer; split each distinct CV_CODEX_ARGS value once.
+    return tuple(shlex.split(raw))
+
+
 def _parse_bool(raw: str | None) -> bool:
     if not raw:
         return False
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in _TRUTHY
 
 
 def _extract_json_payload(raw: str) -> str:
-    try:
-        json.loads(raw)
-        return raw
-    except json.JSONDecodeError:
-        pass
+    # Decode the first object in place: one pass whether or not codex wrapped it in prose.
     start = raw.find("{")
-    end = raw.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        snippet = raw[start : end + 1]
+    if start != -1:
         try:
-            json.loads(snippet)
-            return snippet
+            _, end = _JSON_DECODER.raw_decode(raw, start)
+            return raw[start:end]
         except json.JSONDecodeError:
             pass
     raise ValueError("LLM skill highlight response must be valid JSON")
@@ -236,35 +373,30 @@ def _extract_json_payload(raw: str) -> str:
 def _ensure_full_auto(args: tuple[str, ...]) -> tuple[str, ...]:
     if _has_exec_mode_flag(args):
         return args
-    return args + ("--full-auto",)
+    return (*args, "--full-auto")
 
 
 def _has_exec_mode_flag(args: tuple[str, ...]) -> bool:
-    flags = {"--full-auto", "--dangerously-bypass-approvals-and-sandbox"}
-    return any(arg in flags for arg in args)
+    return not _EXEC_MODE_FLAGS.isdisjoint(args)
 
 
-def _prepare_json_exec(
+def _prepare_exec(
     args: tuple[str, ...],
     *,
     enable_progress: bool,
-) -> tuple[tuple[str, ...], bool, Path, bool]:
+) -> tuple[tuple[str, ...], Path, bool]:
     args_list = list(args)
-    has_json = "--json" in args_list
-    use_json = enable_progress or has_json
-    if enable_progress and not has_json:
+    if enable_progress and "--json" not in args_list:
         args_list.append("--json")
-    last_message_path = Path()
+    last_message_path = _get_output_last_message(args_list)
     cleanup = False
-    if use_json:
-        last_message_path = _get_output_last_message(args_list)
-        if last_message_path == Path():
-            handle = tempfile.NamedTemporaryFile(delete=False, prefix="codex_last_", suffix=".txt")
-            last_message_path = Path(handle.name)
-            handle.close()
-            args_list.extend(["--output-last-message", str(last_message_path)])
-            cleanup = True
-    return tuple(args_list), use_json, last_message_path, cleanup
+    if last_message_path == Path():
+        handle = tempfile.NamedTemporaryFile(delete=False, prefix="codex_last_", suffix=".txt")
+        last_message_path = Path(handle.name)
+        handle.close()
+        args_list.extend(["--output-last-message", str(last_message_path)])
+        cleanup = True
+    return tuple(args_list), last_message_path, cleanup
 
 
 def _get_output_last_message(args: list[str]) -> Path:
@@ -287,6 +419,7 @@ def _run_codex_with_spinner(
             stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
+            close_fds=False,
         )
     else:
         proc = subprocess.Popen(
@@ -295,34 +428,54 @@ def _run_codex_with_spinner(
             stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
+            close_fds=False,
         )
-        assert proc.stdin is not None
+    assert proc.stderr is not None
+    # Drain stderr while codex runs so a chatty child never blocks on a full pipe; started before
+    # the prompt is written so that write cannot deadlock against it either.
+    stderr_chunks: list[str] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()),  # type: ignore[union-attr]
+        daemon=True,
+    )
+    stderr_reader.start()
+    if proc.stdin is not None:
         proc.stdin.write(prompt)
         proc.stdin.close()
     start = time.monotonic()
+    deadline = start + timeout
     spinner = "|/-\\"
     idx = 0
-    while True:
-        ret = proc.poll()
-        if ret is not None:
-            break
-        elapsed = time.monotonic() - start
-        if elapsed > timeout:
-            proc.kill()
-            raise ValueError("codex exec timed out")
-        msg = f"\rcodex: {spinner[idx % len(spinner)]} {elapsed:.0f}s"
-        print(msg, end="", file=sys.stderr, flush=True)
-        idx += 1
-        time.sleep(0.5)
-    print("\rcodex: done".ljust(24), file=sys.stderr)
-    stderr = ""
-    if proc.stderr is not None:
-        stderr = proc.stderr.read()
+    show_spinner = _SPINNER_LOCK.acquire(blocking=False)
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise ValueError("codex exec timed out")
+            # Block in the kernel until exit or the next spinner tick, instead of sleep-then-poll.
+            try:
+                proc.wait(timeout=min(_SPINNER_INTERVAL_SECONDS, remaining))
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            if show_spinner:
+                elapsed = time.monotonic() - start
+                msg = f"\rcodex: {spinner[idx % len(spinner)]} {elapsed:.0f}s"
+                print(msg, end="", file=sys.stderr, flush=True)
+                idx += 1
+        if show_spinner:
+            print("\rcodex: done".ljust(24), file=sys.stderr)
+    finally:
+        if show_spinner:
+            _SPINNER_LOCK.release()
+    stderr_reader.join()
     return subprocess.CompletedProcess(
         cmd,
         proc.returncode,
         stdout="",
-        stderr=stderr,
+        stderr="".join(stderr_chunks),
     )
 
 
@@ -9,8 +9,11 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from cv_compiler.cache import file_stamp
+
 
 @dataclass(frozen=True, slots=True)
 class LLMConfig:
@@ -25,29 +28,50 @@ class LLMConfig:
         prefix: str = "CV_LLM_",
         env_path: Path | None = Path("config/llm.env"),
     ) -> LLMConfig | None:
-        file_values = read_env_file(env_path) if env_path else {}
-        base_url = os.getenv(f"{prefix}BASE_URL") or file_values.get(f"{prefix}BASE_URL")
-        model = os.getenv(f"{prefix}MODEL") or file_values.get(f"{prefix}MODEL")
-        if not base_url or not model:
-            return None
-        api_key = os.getenv(f"{prefix}API_KEY") or file_values.get(f"{prefix}API_KEY")
-        timeout_raw = os.getenv(f"{prefix}TIMEOUT_SECONDS") or file_values.get(
-            f"{prefix}TIMEOUT_SECONDS"
-        )
-        timeout = _parse_timeout(timeout_raw) if timeout_raw else 300
-        return LLMConfig(
-            base_url=base_url,
-            model=model,
-            api_key=api_key,
-            timeout_seconds=timeout,
-        )
+        env_values = tuple(os.getenv(f"{prefix}{key}") for key in _LLM_ENV_KEYS)
+        return _llm_config_from_env(prefix, env_path, file_stamp(env_path), env_values)
+
+
+_LLM_ENV_KEYS = ("BASE_URL", "MODEL", "API_KEY", "TIMEOUT_SECONDS")
+
+
+@lru_cache(maxsize=4)
+def _llm_config_from_env(
+    prefix: str,
+    env_path: Path | None,
+    stamp: tuple[int, int] | None,
+    env_values: tuple[str | None, ...],
+) -> LLMConfig | None:
+    # Cached on (prefix, env file path and stamp, values of the prefixed variables): a changed
+    # variable or an edited env file builds a new config, otherwise the frozen one is reused.
+    file_values = read_env_file(env_path) if env_path else {}
+    base_url, model, api_key, timeout_raw = (
+        value or file_values.get(f"{prefix}{key}")
+        for key, value in zip(_LLM_ENV_KEYS, env_values, strict=True)
+    )
+    if not base_url or not model:
+        return None
+    timeout = _parse_timeout(timeout_raw) if timeout_raw else 300
+    return LLMConfig(
+        base_url=base_url,
+        model=model,
+        api_key=api_key,
+        timeout_seconds=timeout,
+    )
 
 
 def read_env_file(path: Path | None) -> dict[str, str]:
-    if path is None or not path.exists():
+    stamp = file_stamp(path)
+    if path is None or stamp is None:
         return {}
+    # Callers may mutate the result (see `upsert_env_value`), so hand out a copy of the memo.
+    return dict(_parse_env_file(str(path), stamp))
+
+
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, stamp: tuple[int, int]) -> dict[str, str]:
     values: dict[str, str] = {}
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
+    for raw_line in Path(path).read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
@@ -10,13 +10,17 @@ import re
 import shutil
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from cv_compiler.cache import file_stamp
 from cv_compiler.llm.base import ExperienceDraft
+from cv_compiler.llm.prompts import read_prompt_text
 from cv_compiler.schema.models import JobSpec, ProjectEntry
+from cv_compiler.yaml_compat import YamlDumper, YamlLoader
 
 LLM_PREFIX = "llm_"
 USER_PREFIX = "user_"
@@ -28,6 +32,7 @@ _ACTIVE_LLM_RE = re.compile(r"^llm_[a-z0-9_]+$")
 _THINK_RE = re.compile(r"<think>.*?</think>", re.S)
 _YAML_START_RE = re.compile(r"(?m)^\s*experiences\s*:\s*$")
 _KEYWORD_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+.#-]*", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"\{\{(TEMPLATES|PROJECTS|JOB)\}\}")
 
 
 @dataclass(frozen=True, slots=True)
@@ -37,7 +42,15 @@ class ExperienceTemplate:
 
 
 def load_experience_templates(path: Path) -> tuple[ExperienceTemplate, ...]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return _load_experience_templates(str(path), file_stamp(path))
+
+
+@lru_cache(maxsize=8)
+def _load_experience_templates(
+    path_str: str, stamp: tuple[int, int] | None
+) -> tuple[ExperienceTemplate, ...]:
+    path = Path(path_str)
+    raw = yaml.load(path.read_text(encoding="utf-8"), Loader=YamlLoader)
     if not isinstance(raw, list):
         raise ValueError(f"Templates must be a list: {path}")
     out: list[ExperienceTemplate] = []
@@ -59,7 +72,7 @@ def build_experience_prompt(
     projects: tuple[ProjectEntry, ...],
     job: JobSpec | None,
 ) -> str:
-    prompt = prompt_path.read_text(encoding="utf-8")
+    prompt = read_prompt_text(prompt_path)
     template_payload = [{"id": t.id, "template": t.template} for t in templates]
     project_payload = [
         {
@@ -83,19 +96,22 @@ def build_experience_prompt(
             "keywords": list(job.keywords),
         }
 
-    prompt = prompt.replace(
-        "{{TEMPLATES}}", yaml.safe_dump(template_payload, sort_keys=False).strip()
-    )
-    prompt = prompt.replace(
-        "{{PROJECTS}}", yaml.safe_dump(project_payload, sort_keys=False).strip()
-    )
-    prompt = prompt.replace("{{JOB}}", yaml.safe_dump(job_payload, sort_keys=False).strip())
-    return prompt
+    sections = {
+        "TEMPLATES": _dump_yaml(template_payload),
+        "PROJECTS": _dump_yaml(project_payload),
+        "JOB": _dump_yaml(job_payload),
+    }
+    # One pass over the prompt; dumped sections are never rescanned for placeholders.
+    return _PLACEHOLDER_RE.sub(lambda match: sections[match.group(1)], prompt)
+
+
+def _dump_yaml(payload: Any) -> str:
+    return yaml.dump(payload, Dumper=YamlDumper, sort_keys=False).strip()
 
 
 def parse_experience_drafts(text: str) -> tuple[ExperienceDraft, ...]:
     cleaned = _extract_yaml_payload(text)
-    data = yaml.safe_load(cleaned)
+    data = yaml.load(cleaned, Loader=YamlLoader)
     if not isinstance(data, dict) or "experiences" not in data:
         raise ValueError("LLM response must be YAML with an `experiences` list")
     raw_exps = data["experiences"]
@@ -290,7 +306,10 @@ def restore_llm_experience_files(backup_dir: Path, data_dir: Path) -> None:
     shutil.rmtree(backup_dir, ignore_errors=True)
 
 
-def _collect_allowed_numbers(projects: tuple[ProjectEntry, ...]) -> set[str]:
+# Drafts are often re-validated against the same projects (retries, draft checks), so the
+# per-bullet regex scans are cached on the hashable projects tuple.
+@lru_cache(maxsize=16)
+def _collect_allowed_numbers(projects: tuple[ProjectEntry, ...]) -> frozenset[str]:
     tokens: set[str] = set()
     for p in projects:
         text_values: list[str | None] = [p.name, p.start_date, p.end_date, *p.bullets]
@@ -307,12 +326,13 @@ def _collect_allowed_numbers(projects: tuple[ProjectEntry, ...]) -> set[str]:
             if not text:
                 continue
             tokens.update(_NUM_TOKEN_RE.findall(text))
-    return tokens
+    return frozenset(tokens)
 
 
+@lru_cache(maxsize=16)
 def _collect_allowed_keywords(
     projects: tuple[ProjectEntry, ...],
-) -> tuple[set[str], set[str]]:
+) -> tuple[frozenset[str], frozenset[str]]:
     phrases: set[str] = set()
     tokens: set[str] = set()
     for p in projects:
@@ -326,12 +346,12 @@ def _collect_allowed_keywords(
             if lowered:
                 phrases.add(lowered)
             tokens.update(t.lower() for t in _KEYWORD_TOKEN_RE.findall(lowered))
-    return phrases, tokens
+    return frozenset(phrases), frozenset(tokens)
 
 
 def _validate_bullet_numbers(
     bullet: str,
-    allowed_numbers: set[str],
+    allowed_numbers: frozenset[str],
     *,
     warnings: list[str],
 ) -> str:
@@ -359,8 +379,8 @@ def _parse_keywords(raw: object) -> tuple[str, ...]:
 def _validate_keywords(
     keywords: tuple[str, ...],
     *,
-    allowed_phrases: set[str],
-    allowed_tokens: set[str],
+    allowed_phrases: frozenset[str],
+    allowed_tokens: frozenset[str],
     warnings: list[str],
     exp_id: str,
 ) -> tuple[str, ...]:
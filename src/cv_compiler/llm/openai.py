@@ -8,8 +8,11 @@ Uses an HTTP endpoint specified by LLMConfig. This provider is optional and only
 from __future__ import annotations
 
 import json
+import math
+import time
 from collections.abc import Sequence
 from pathlib import Path
+from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 from cv_compiler.llm.base import (
@@ -36,6 +39,12 @@ from cv_compiler.llm.summary import (
 )
 from cv_compiler.schema.models import JobSpec, Profile, ProjectEntry
 
+_MAX_ATTEMPTS = 3
+_BACKOFF_SECONDS = 1.0
+_MAX_RETRY_AFTER_SECONDS = 30.0
+# Rate limiting and transient gateway/server errors; anything else is a real failure.
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
 
 class OpenAIProvider(LLMProvider):
     name = "openai"
@@ -129,15 +138,47 @@ def request_chat_completion(
         headers["Authorization"] = f"Bearer {config.api_key}"
 
     req = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(req, timeout=config.timeout_seconds) as resp:  # noqa: S310
-        body = resp.read().decode("utf-8")
-    parsed = json.loads(body)
+    # json.loads detects UTF-8/16/32 in bytes itself, so the body is never decoded to str first.
+    parsed = json.loads(_post_with_retries(req, timeout=config.timeout_seconds))
     content = extract_chat_content(parsed)
     if content is None:
         raise ValueError("Unexpected LLM response shape")
     return content
 
 
+def _post_with_retries(req: Request, *, timeout: int) -> bytes:
+    """POST `req`, retrying rate limits, gateway errors, and dropped connections with backoff."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            with urlopen(req, timeout=timeout) as resp:  # noqa: S310
+                return resp.read()
+        except HTTPError as exc:
+            if exc.code not in _RETRY_STATUS or attempt == _MAX_ATTEMPTS - 1:
+                raise
+            retry_after = _retry_after_seconds(exc)
+            delay = _BACKOFF_SECONDS * 2**attempt if retry_after is None else retry_after
+        except URLError:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            delay = _BACKOFF_SECONDS * 2**attempt
+        time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _retry_after_seconds(exc: HTTPError) -> float | None:
+    raw = exc.headers.get("Retry-After") if exc.headers else None
+    if not raw:
+        return None
+    try:
+        seconds = float(raw)
+    except ValueError:
+        # HTTP-date values are not worth parsing; the caller falls back to backoff.
+        return None
+    if not math.isfinite(seconds) or seconds < 0:
+        return None
+    return min(seconds, _MAX_RETRY_AFTER_SECONDS)
+
+
 def build_chat_endpoint(base_url: str) -> str:
     url = base_url.rstrip("/")
     if url.endswith("/v1"):
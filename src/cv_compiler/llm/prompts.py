@@ -0,0 +1,22 @@
+"""
+Prompt-file loading shared by the LLM prompt builders.
+
+Prompt files are re-read only when their mtime or size changes, so repeated builds in one process
+skip the disk read and decode while edits still take effect.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+from cv_compiler.cache import file_stamp
+
+
+def read_prompt_text(path: Path) -> str:
+    return _read_text(str(path), file_stamp(path))
+
+
+@lru_cache(maxsize=32)
+def _read_text(path: str, stamp: tuple[int, int] | None) -> str:
+    return Path(path).read_text(encoding="utf-8")
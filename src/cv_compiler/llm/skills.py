@@ -11,6 +11,7 @@ from typing import Any
 
 import yaml
 
+from cv_compiler.llm.prompts import read_prompt_text
 from cv_compiler.schema.models import JobSpec, Profile
 
 _MAX_HIGHLIGHTS = 5
@@ -30,7 +31,7 @@ def build_skills_prompt(
     profile: Profile,
     job: JobSpec | None,
 ) -> str:
-    prompt = prompt_path.read_text(encoding="utf-8")
+    prompt = read_prompt_text(prompt_path)
     prompt = prompt.replace("{{PROFILE_HEADLINE}}", profile.headline)
     job_payload: dict[str, Any] = {}
     if job is not None:
@@ -11,6 +11,7 @@ from typing import Any
 
 import yaml
 
+from cv_compiler.llm.prompts import read_prompt_text
 from cv_compiler.schema.models import JobSpec, ProjectEntry
 
 
@@ -26,7 +27,7 @@ def build_experience_summary_prompt(
     projects: tuple[ProjectEntry, ...],
     job: JobSpec | None,
 ) -> str:
-    prompt = prompt_path.read_text(encoding="utf-8")
+    prompt = read_prompt_text(prompt_path)
     project_payload = [
         {
             "id": p.id,
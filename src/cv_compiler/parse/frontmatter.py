@@ -14,6 +14,8 @@ from typing import Any
 
 import yaml
 
+from cv_compiler.yaml_compat import YamlLoader
+
 
 @dataclass(frozen=True, slots=True)
 class MarkdownDocument:
@@ -52,7 +54,7 @@ def parse_markdown_frontmatter(path: Path) -> MarkdownDocument:
     if not yaml_text:
         frontmatter: Mapping[str, Any] = {}
     else:
-        loaded = yaml.safe_load(yaml_text)
+        loaded = yaml.load(yaml_text, Loader=YamlLoader)
         if loaded is None:
             frontmatter = {}
         elif not isinstance(loaded, dict):
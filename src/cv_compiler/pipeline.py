@@ -10,9 +10,12 @@ from __future__ import annotations
 import dataclasses
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from cv_compiler.cache import file_stamp
 from cv_compiler.lint.linter import lint_build_inputs, lint_rendered_output
 from cv_compiler.llm.base import BulletRewriteRequest, LLMProvider
 from cv_compiler.llm.experience import (
@@ -61,6 +64,27 @@ def _sanitize_stem(stem: str) -> str:
     return safe.strip("_") or "job"
 
 
+def job_output_stem(job_path: Path | None) -> str:
+    """Return the stem (`cv_generic` or `cv_<job id>`) of the file `build_cv` writes for a job."""
+    return _output_stem(_load_job(job_path))
+
+
+def _output_stem(job: JobSpec | None) -> str:
+    return "cv_generic" if job is None else f"cv_{_sanitize_stem(job.id)}"
+
+
+def _load_job(job_path: Path | None) -> JobSpec | None:
+    if job_path is None:
+        return None
+    return _load_job_spec(str(job_path), file_stamp(job_path))
+
+
+@lru_cache(maxsize=32)
+def _load_job_spec(path: str, stamp: tuple[int, int] | None) -> JobSpec:
+    # Shared by `job_output_stem` and `build_cv`, so checking output names does not parse twice.
+    return load_job_spec(Path(path))
+
+
 def _apply_rewrites(data: CanonicalData, *, rewrites: dict[str, tuple[str, ...]]) -> CanonicalData:
     exp = []
     for e in data.experience:
@@ -112,73 +136,84 @@ def build_cv(request: BuildRequest) -> BuildResult:
     data = load_canonical_data(request.data_dir)
     issues: list[LintIssue] = list(lint_build_inputs(data))
 
-    job = load_job_spec(request.job_path) if request.job_path else None
+    job = _load_job(request.job_path)
 
     highlighted_skills: tuple[str, ...] = ()
     skills_filter: tuple[str, ...] = ()
     experience_summary: str | None = None
     if request.llm is not None:
-        try:
-            if request.experience_regenerate:
-                archive_user_experience_files(request.data_dir)
-            drafts = request.llm.generate_experience(data.projects, job)
-            if drafts:
-                experience_warnings: list[str] = []
-                backup_dir = backup_llm_experience_files(request.data_dir)
-                try:
-                    write_experience_artifacts(
-                        request.data_dir,
-                        projects=tuple(data.projects),
-                        drafts=tuple(drafts),
-                        warnings=experience_warnings,
-                    )
-                except Exception:
+        all_skills = tuple(item for cat in data.skills.categories for item in cat.items)
+        summary_path = request.data_dir / "experience_summary.md"
+        # Skill highlighting and the summary only read profile/skills/projects, which experience
+        # generation never rewrites, so they run alongside it. Results are still consumed below in
+        # the original order, keeping the issue list identical to a sequential run. Leaving the
+        # `with` block joins both calls on every path, including when experience generation raises.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            skills_future = (
+                executor.submit(request.llm.highlight_skills, all_skills, data.profile, job)
+                if all_skills
+                else None
+            )
+            summary_future = (
+                executor.submit(request.llm.generate_experience_summary, data.projects, job)
+                if request.experience_summary and not summary_path.exists()
+                else None
+            )
+            try:
+                if request.experience_regenerate:
+                    archive_user_experience_files(request.data_dir)
+                drafts = request.llm.generate_experience(data.projects, job)
+                if drafts:
+                    experience_warnings: list[str] = []
+                    backup_dir = backup_llm_experience_files(request.data_dir)
+                    try:
+                        write_experience_artifacts(
+                            request.data_dir,
+                            projects=tuple(data.projects),
+                            drafts=tuple(drafts),
+                            warnings=experience_warnings,
+                        )
+                    except Exception:
+                        if backup_dir is not None:
+                            restore_llm_experience_files(backup_dir, request.data_dir)
+                        raise
                     if backup_dir is not None:
-                        restore_llm_experience_files(backup_dir, request.data_dir)
-                    raise
-                if backup_dir is not None:
-                    shutil.rmtree(backup_dir, ignore_errors=True)
-                data = load_canonical_data(request.data_dir)
-                issues = list(lint_build_inputs(data))
-                for warning in experience_warnings:
-                    issues.append(
-                        LintIssue(
-                            code="LLM_EXPERIENCE_WARNING",
-                            message=warning,
-                            severity=Severity.WARNING,
-                            source_path=None,
+                        shutil.rmtree(backup_dir, ignore_errors=True)
+                    data = load_canonical_data(request.data_dir)
+                    issues = list(lint_build_inputs(data))
+                    for warning in experience_warnings:
+                        issues.append(
+                            LintIssue(
+                                code="LLM_EXPERIENCE_WARNING",
+                                message=warning,
+                                severity=Severity.WARNING,
+                                source_path=None,
+                            )
                         )
+            except Exception as exc:  # noqa: BLE001
+                issues.append(
+                    LintIssue(
+                        code="LLM_GENERATION_FAILED",
+                        message=str(exc),
+                        severity=Severity.WARNING,
+                        source_path=None,
                     )
-        except Exception as exc:  # noqa: BLE001
-            issues.append(
-                LintIssue(
-                    code="LLM_GENERATION_FAILED",
-                    message=str(exc),
-                    severity=Severity.WARNING,
-                    source_path=None,
                 )
-            )
-        try:
-            all_skills = tuple(item for cat in data.skills.categories for item in cat.items)
-            if all_skills:
-                highlighted_skills = tuple(
-                    request.llm.highlight_skills(all_skills, data.profile, job)
-                )
-        except Exception as exc:  # noqa: BLE001
-            issues.append(
-                LintIssue(
-                    code="LLM_SKILL_HIGHLIGHT_FAILED",
-                    message=str(exc),
-                    severity=Severity.WARNING,
-                    source_path=None,
+            try:
+                if skills_future is not None:
+                    highlighted_skills = tuple(skills_future.result())
+            except Exception as exc:  # noqa: BLE001
+                issues.append(
+                    LintIssue(
+                        code="LLM_SKILL_HIGHLIGHT_FAILED",
+                        message=str(exc),
+                        severity=Severity.WARNING,
+                        source_path=None,
+                    )
                 )
-            )
-        if request.experience_summary:
-            summary_path = request.data_dir / "experience_summary.md"
-            if not summary_path.exists():
+            if summary_future is not None:
                 try:
-                    summary_text = request.llm.generate_experience_summary(data.projects, job)
-                    summary_text = summary_text.strip()
+                    summary_text = summary_future.result().strip()
                     if summary_text:
                         summary_path.write_text(
                             _format_experience_summary(summary_text),
@@ -239,8 +274,7 @@ def build_cv(request: BuildRequest) -> BuildResult:
         rewrites = {r.item_id: r.bullets for r in results}
         data = _apply_rewrites(data, rewrites=rewrites)
 
-    output_stem = "cv_generic" if job is None else f"cv_{_sanitize_stem(job.id)}"
-    output_path = request.out_dir / f"{output_stem}.{request.format.value}"
+    output_path = request.out_dir / f"{_output_stem(job)}.{request.format.value}"
 
     if request.experience_summary and experience_summary is None:
         summary_path = request.data_dir / "experience_summary.md"
@@ -1,9 +1,19 @@
 """
 Utility helpers for validating and inspecting canonical data.
+
+Names are exported lazily so that importing one checker (e.g. `project_check`) does not pull in
+the LLM stack that `llm_draft_check` depends on.
 """
 
-from .llm_draft_check import DraftIssue, collect_draft_issues, load_draft_text
-from .project_check import ProjectIssue, collect_project_issues
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cv_compiler.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .llm_draft_check import DraftIssue, collect_draft_issues, load_draft_text
+    from .project_check import ProjectIssue, collect_project_issues
 
 __all__ = [
     "DraftIssue",
@@ -12,3 +22,15 @@ __all__ = [
     "collect_project_issues",
     "load_draft_text",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "DraftIssue": ".llm_draft_check",
+        "collect_draft_issues": ".llm_draft_check",
+        "load_draft_text": ".llm_draft_check",
+        "ProjectIssue": ".project_check",
+        "collect_project_issues": ".project_check",
+    },
+)
@@ -135,6 +135,9 @@ def collect_draft_issues(
 
 def load_draft_text(path: Path) -> str:
     raw = path.read_text(encoding="utf-8")
+    # YAML drafts (the common case) can't be JSON objects; skip the doomed decode attempt.
+    if not raw.lstrip().startswith("{"):
+        return raw
     try:
         parsed = json.loads(raw)
     except json.JSONDecodeError:
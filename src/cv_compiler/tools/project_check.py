@@ -6,11 +6,14 @@ Validates per-project frontmatter fields without loading the full dataset.
 
 from __future__ import annotations
 
+import json
+import os
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from cv_compiler.cache import write_cache_text
 from cv_compiler.parse.frontmatter import parse_markdown_frontmatter
 
 
@@ -22,9 +25,25 @@ class ProjectIssue:
     severity: str = "ERROR"
 
 
-def collect_project_issues(projects_dir: Path) -> tuple[ProjectIssue, ...]:
+_CACHE_VERSION = 1
+
+
+def collect_project_issues(
+    projects_dir: Path, *, cache_path: Path | None = None
+) -> tuple[ProjectIssue, ...]:
+    """
+    Validate every `*.md` project file in `projects_dir`.
+
+    When `cache_path` is given, per-file results are cached keyed on `(mtime_ns, size)` and
+    reused for unchanged files. Duplicate-id detection always runs across all files.
+    """
     issues: list[ProjectIssue] = []
-    if not projects_dir.exists():
+    try:
+        with os.scandir(projects_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".md") and e.is_file()), key=lambda e: e.name
+            )
+    except (FileNotFoundError, NotADirectoryError):
         issues.append(
             ProjectIssue(
                 path=projects_dir,
@@ -34,34 +53,31 @@ def collect_project_issues(projects_dir: Path) -> tuple[ProjectIssue, ...]:
         )
         return tuple(issues)
 
+    cache_key = os.path.abspath(projects_dir)
+    cache = _load_cache(cache_path) if cache_path else {}
+    cached_records = cache.get(cache_key, {})
+    records: dict[str, dict[str, Any]] = {}
     seen_ids: dict[str, Path] = {}
-    for path in sorted(projects_dir.glob("*.md")):
-        try:
-            doc = parse_markdown_frontmatter(path)
-        except Exception as exc:  # noqa: BLE001
-            issues.append(
-                ProjectIssue(
-                    path=path,
-                    code="FRONTMATTER_INVALID",
-                    message=f"Failed to parse frontmatter: {exc}",
-                )
-            )
-            continue
-
-        fm = doc.frontmatter
-        if not isinstance(fm, Mapping):
-            issues.append(
-                ProjectIssue(
-                    path=path,
-                    code="FRONTMATTER_MISSING",
-                    message="Missing frontmatter mapping.",
-                )
-            )
-            continue
-
-        _check_required_str(fm, "id", path, issues)
-        entry_id = fm.get("id")
-        if isinstance(entry_id, str) and entry_id.strip():
+    for entry in entries:
+        path = Path(entry.path)
+        stat = entry.stat()
+        record = cached_records.get(entry.name)
+        if (
+            record is None
+            or record.get("mtime_ns") != stat.st_mtime_ns
+            or record.get("size") != stat.st_size
+        ):
+            entry_id, file_issues = _check_project_file(path)
+            record = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "id": entry_id,
+                "issues": [[i.code, i.message, i.severity] for i in file_issues],
+            }
+        records[entry.name] = record
+
+        entry_id = record["id"]
+        if entry_id is not None:
             existing = seen_ids.get(entry_id)
             if existing is not None:
                 issues.append(
@@ -73,18 +89,71 @@ def collect_project_issues(projects_dir: Path) -> tuple[ProjectIssue, ...]:
                 )
             else:
                 seen_ids[entry_id] = path
+        issues.extend(
+            ProjectIssue(path=path, code=code, message=message, severity=severity)
+            for code, message, severity in record["issues"]
+        )
 
-        _check_required_str(fm, "name", path, issues)
-        _check_required_list_of_str(fm, "tags", path, issues)
-        _check_required_list_of_str(fm, "bullets", path, issues)
-        _check_optional_str(fm, "company", path, issues)
-        _check_optional_str(fm, "role", path, issues)
-        _check_optional_str(fm, "start_date", path, issues)
-        _check_optional_str(fm, "end_date", path, issues)
-
+    if cache_path is not None:
+        cache[cache_key] = records
+        _write_cache(cache_path, cache)
     return tuple(issues)
 
 
+def _check_project_file(path: Path) -> tuple[str | None, list[ProjectIssue]]:
+    """Validate one project file; returns its usable id (if any) and per-file issues."""
+    issues: list[ProjectIssue] = []
+    try:
+        doc = parse_markdown_frontmatter(path)
+    except Exception as exc:  # noqa: BLE001
+        issues.append(
+            ProjectIssue(
+                path=path,
+                code="FRONTMATTER_INVALID",
+                message=f"Failed to parse frontmatter: {exc}",
+            )
+        )
+        return None, issues
+
+    fm = doc.frontmatter
+    if not isinstance(fm, Mapping):
+        issues.append(
+            ProjectIssue(
+                path=path,
+                code="FRONTMATTER_MISSING",
+                message="Missing frontmatter mapping.",
+            )
+        )
+        return None, issues
+
+    _check_required_str(fm, "id", path, issues)
+    _check_required_str(fm, "name", path, issues)
+    _check_required_list_of_str(fm, "tags", path, issues)
+    _check_required_list_of_str(fm, "bullets", path, issues)
+    _check_optional_str(fm, "company", path, issues)
+    _check_optional_str(fm, "role", path, issues)
+    _check_optional_str(fm, "start_date", path, issues)
+    _check_optional_str(fm, "end_date", path, issues)
+
+    entry_id = fm.get("id")
+    return (entry_id if isinstance(entry_id, str) and entry_id.strip() else None), issues
+
+
+def _load_cache(path: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != _CACHE_VERSION:
+        return {}
+    dirs = raw.get("dirs")
+    return dirs if isinstance(dirs, dict) else {}
+
+
+def _write_cache(path: Path, dirs: dict[str, dict[str, dict[str, Any]]]) -> None:
+    write_cache_text(path, json.dumps({"version": _CACHE_VERSION, "dirs": dirs}, sort_keys=True))
+
+
 def _check_required_str(
     fm: Mapping[str, Any],
     key: str,
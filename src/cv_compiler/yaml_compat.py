@@ -0,0 +1,17 @@
+"""
+PyYAML loader and dumper selection.
+
+Prefers the libyaml-backed safe classes, which are several times faster, and falls back to the
+pure-Python ones when PyYAML was built without libyaml. Both variants accept the same documents.
+"""
+
+from __future__ import annotations
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+__all__ = ["YamlDumper", "YamlLoader"]
@@ -9,11 +9,15 @@ from __future__ import annotations
 
 import hashlib
 import tempfile
+import threading
 import unittest
+from collections.abc import Sequence
 from pathlib import Path
 
+from cv_compiler.llm.base import ExperienceDraft, NoopProvider
 from cv_compiler.pipeline import BuildRequest, build_cv
 from cv_compiler.render.types import RenderFormat
+from cv_compiler.schema.models import JobSpec, Profile, ProjectEntry
 from cv_compiler.types import Severity
 
 
@@ -23,6 +27,27 @@ def _sha256(path: Path) -> str:
     return h.hexdigest()
 
 
+class _OverlapProvider(NoopProvider):
+    """Records whether skill highlighting started while experience generation was running."""
+
+    def __init__(self) -> None:
+        # NoopProvider is a frozen dataclass; the recorders are set past its __setattr__.
+        object.__setattr__(self, "skills_started", threading.Event())
+        object.__setattr__(self, "overlapped", [])
+
+    def generate_experience(
+        self, projects: Sequence[ProjectEntry], job: JobSpec | None
+    ) -> Sequence[ExperienceDraft]:
+        self.overlapped.append(self.skills_started.wait(timeout=5))
+        return []
+
+    def highlight_skills(
+        self, skills: Sequence[str], profile: Profile, job: JobSpec | None
+    ) -> Sequence[str]:
+        self.skills_started.set()
+        raise ValueError("no highlights")
+
+
 class TestBuildExample(unittest.TestCase):
     def test_build_example_generic_is_deterministic(self) -> None:
         root = Path(__file__).resolve().parents[1]
@@ -116,3 +141,22 @@ class TestBuildExample(unittest.TestCase):
             assert result.markdown_path is not None
             self.assertEqual(result.output_path, result.markdown_path)
             self.assertIsNone(result.pdf_path)
+
+    def test_llm_skill_highlight_overlaps_experience_generation(self) -> None:
+        root = Path(__file__).resolve().parents[1]
+        provider = _OverlapProvider()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            result = build_cv(
+                BuildRequest(
+                    data_dir=root / "examples" / "basic" / "data",
+                    job_path=None,
+                    template_dir=root / "examples" / "basic" / "templates",
+                    out_dir=Path(tmp),
+                    format=RenderFormat.MARKDOWN,
+                    llm=provider,
+                )
+            )
+        self.assertEqual(provider.overlapped, [True])
+        codes = [issue.code for issue in result.issues]
+        self.assertIn("LLM_SKILL_HIGHLIGHT_FAILED", codes)
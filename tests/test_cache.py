@@ -0,0 +1,32 @@
+"""
+Tests for the shared on-disk cache helpers.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from cv_compiler.cache import write_cache_text
+
+
+class TestWriteCacheText(unittest.TestCase):
+    def test_writes_and_replaces_without_leaving_temp_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "entry.json"
+            write_cache_text(path, "first")
+            write_cache_text(path, "second")
+            self.assertEqual(path.read_text(encoding="utf-8"), "second")
+            self.assertEqual([p.name for p in path.parent.iterdir()], ["entry.json"])
+
+    def test_write_failure_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            blocker = Path(tmp) / "blocker"
+            blocker.write_text("not a folder", encoding="utf-8")
+            write_cache_text(blocker / "entry.json", "ignored")
+            self.assertTrue(blocker.is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
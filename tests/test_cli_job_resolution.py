@@ -4,11 +4,16 @@ Tests for job path resolution logic.
 
 from __future__ import annotations
 
+import dataclasses
 import tempfile
 import unittest
 from pathlib import Path
 
-from cv_compiler.cli import _resolve_job_paths
+from cv_compiler.cli import _build_in_processes, _has_shared_output_stem, _resolve_job_paths
+from cv_compiler.pipeline import BuildRequest, job_output_stem
+from cv_compiler.render.types import RenderFormat
+
+_EXAMPLE_ROOT = Path(__file__).resolve().parents[1] / "examples" / "basic"
 
 
 class TestJobResolution(unittest.TestCase):
@@ -41,3 +46,62 @@ class TestJobResolution(unittest.TestCase):
             resolved = _resolve_job_paths(None, jobs_dir=jobs_dir)
 
             self.assertEqual(resolved, (None,))
+
+    def test_missing_jobs_folder_falls_back_to_generic(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            resolved = _resolve_job_paths(None, jobs_dir=Path(tmp) / "missing")
+
+            self.assertEqual(resolved, (None,))
+
+    def test_jobs_path_that_is_a_file_falls_back_to_generic(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_file = Path(tmp) / "jobs"
+            jobs_file.write_text("not a folder", encoding="utf-8")
+
+            resolved = _resolve_job_paths(None, jobs_dir=jobs_file)
+
+            self.assertEqual(resolved, (None,))
+
+
+class TestMultiJobBuild(unittest.TestCase):
+    def _requests(self, jobs_dir: Path, out_dir: Path, ids: list[str]) -> list[BuildRequest]:
+        job_text = (_EXAMPLE_ROOT / "jobs" / "backend_engineer.md").read_text(encoding="utf-8")
+        base = BuildRequest(
+            data_dir=_EXAMPLE_ROOT / "data",
+            job_path=None,
+            template_dir=_EXAMPLE_ROOT / "templates",
+            out_dir=out_dir,
+            format=RenderFormat.MARKDOWN,
+        )
+        requests = []
+        for idx, job_id in enumerate(ids):
+            job_path = jobs_dir / f"job_{idx}.md"
+            job_path.write_text(
+                job_text.replace("id: job_backend_engineer", f"id: {job_id}", 1),
+                encoding="utf-8",
+            )
+            requests.append(dataclasses.replace(base, job_path=job_path))
+        return requests
+
+    def test_process_pool_builds_each_job_in_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            requests = self._requests(root, root / "out", ["job_a", "job_b"])
+            self.assertFalse(_has_shared_output_stem(requests))
+
+            results = list(_build_in_processes(requests))
+
+            self.assertEqual(
+                [result.output_path.name for result in results],
+                ["cv_job_a.md", "cv_job_b.md"],
+            )
+            for result in results:
+                self.assertTrue(result.output_path.exists())
+
+    def test_duplicate_job_ids_share_an_output_stem(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            requests = self._requests(root, root / "out", ["job_a", "job_b", "job_a"])
+
+            self.assertEqual(job_output_stem(requests[2].job_path), "cv_job_a")
+            self.assertTrue(_has_shared_output_stem(requests))
@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import io
 import unittest
-from contextlib import redirect_stderr
+from contextlib import redirect_stderr, redirect_stdout
 
-from cv_compiler.cli import _build_parser
+from cv_compiler import __version__
+from cv_compiler.cli import _build_parser, _sniff_subcommand, main
 
 
 class TestCliParsing(unittest.TestCase):
@@ -45,3 +46,25 @@ class TestCliParsing(unittest.TestCase):
         parser = _build_parser()
         args = parser.parse_args(["to_mds_from_pdf", "--pdf", "data/cv.pdf"])
         self.assertEqual(args.pdf, "data/cv.pdf")
+        self.assertEqual(args.max_pages, 10)
+
+    def test_sniffed_subcommand_builds_only_that_parser(self) -> None:
+        self.assertEqual(_sniff_subcommand(["lint", "--example", "basic"]), "lint")
+        self.assertIsNone(_sniff_subcommand(["--help"]))
+        self.assertIsNone(_sniff_subcommand(["unknown"]))
+        parser = _build_parser(_sniff_subcommand(["lint", "--example", "basic"]))
+        args = parser.parse_args(["lint", "--example", "basic"])
+        self.assertEqual(args.example, "basic")
+
+    def test_build_rejects_unknown_llm_provider(self) -> None:
+        parser = _build_parser()
+        with redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                parser.parse_args(["build", "--llm", "bogus"])
+
+    def test_version_flag_prints_package_version(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["--version"])
+        self.assertEqual(code, 0)
+        self.assertEqual(out.getvalue(), f"cv {__version__}\n")
@@ -4,11 +4,24 @@ Tests for Codex exec config parsing.
 
 from __future__ import annotations
 
+import dataclasses
+import io
 import os
+import sys
+import tempfile
 import unittest
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stderr
+from pathlib import Path
+from unittest import mock
 
-from cv_compiler.llm.codex import CodexExecConfig, _ensure_full_auto
+from cv_compiler.llm.codex import (
+    _SPINNER_LOCK,
+    CodexExecConfig,
+    CodexExecProvider,
+    _ensure_full_auto,
+    _extract_json_payload,
+    _run_codex_with_spinner,
+)
 
 
 @contextmanager
@@ -50,6 +63,8 @@ class TestCodexExecConfig(unittest.TestCase):
             "CV_CODEX_MODEL",
             "CV_CODEX_TIMEOUT_SECONDS",
             "CV_CODEX_PROMPT_MODE",
+            "CV_CODEX_MAX_PARALLEL",
+            "CV_CODEX_CACHE",
         ]
         with _clear_env(keys):
             config = CodexExecConfig.from_env(env_path=None)
@@ -59,6 +74,8 @@ class TestCodexExecConfig(unittest.TestCase):
         self.assertEqual(config.timeout_seconds, 600)
         self.assertEqual(config.prompt_mode, "stdin")
         self.assertFalse(config.progress)
+        self.assertEqual(config.max_parallel, 3)
+        self.assertIsNone(config.cache_dir)
 
     def test_args_and_prompt_mode(self) -> None:
         with _temp_env(
@@ -79,6 +96,102 @@ class TestCodexExecConfig(unittest.TestCase):
             config = CodexExecConfig.from_env(env_path=None)
         self.assertEqual(config.prompt_mode, "stdin")
 
+    def test_invalid_max_parallel_falls_back(self) -> None:
+        with _temp_env({"CV_CODEX_MAX_PARALLEL": "0"}):
+            config = CodexExecConfig.from_env(env_path=None)
+        self.assertEqual(config.max_parallel, 3)
+        with _temp_env({"CV_CODEX_MAX_PARALLEL": "1"}):
+            config = CodexExecConfig.from_env(env_path=None)
+        self.assertEqual(config.max_parallel, 1)
+
+    def test_cached_output_skips_codex_exec(self) -> None:
+        with _clear_env(["CV_CODEX_ARGS", "CV_CODEX_CACHE_TTL"]):
+            base = CodexExecConfig.from_env(env_path=None)
+        with tempfile.TemporaryDirectory() as tmp:
+            config = dataclasses.replace(base, command=sys.executable, cache_dir=Path(tmp))
+            provider = CodexExecProvider(config)
+            with mock.patch.object(
+                CodexExecProvider, "_exec_codex", return_value="output"
+            ) as exec_codex:
+                self.assertEqual(provider._run_codex("prompt", str.upper), "OUTPUT")
+                self.assertEqual(provider._run_codex("prompt", str.upper), "OUTPUT")
+                self.assertEqual(exec_codex.call_count, 1)
+                self.assertEqual(provider.clear_cache(), 1)
+                provider._run_codex("prompt", str.upper)
+                self.assertEqual(exec_codex.call_count, 2)
+
+    def test_unparseable_output_is_not_cached(self) -> None:
+        with _clear_env(["CV_CODEX_ARGS", "CV_CODEX_CACHE_TTL"]):
+            base = CodexExecConfig.from_env(env_path=None)
+        with tempfile.TemporaryDirectory() as tmp:
+            config = dataclasses.replace(base, command=sys.executable, cache_dir=Path(tmp))
+            provider = CodexExecProvider(config)
+            with mock.patch.object(
+                CodexExecProvider, "_exec_codex", return_value="truncated {"
+            ) as exec_codex:
+                for _ in range(2):
+                    with self.assertRaises(ValueError):
+                        provider._run_codex("prompt", _extract_json_payload)
+                self.assertEqual(exec_codex.call_count, 2)
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+
+    def test_extract_json_payload_finds_object_in_prose(self) -> None:
+        payload = '{"highlighted_skills": ["Python", "{braces}"]}'
+        self.assertEqual(_extract_json_payload(payload), payload)
+        self.assertEqual(_extract_json_payload(f"Here you go:\n{payload}\nDone."), payload)
+        with self.assertRaises(ValueError):
+            _extract_json_payload("no json here")
+
+    def test_missing_command_fails_at_construction(self) -> None:
+        with _clear_env(["CV_CODEX_ARGS"]):
+            base = CodexExecConfig.from_env(env_path=None)
+        config = dataclasses.replace(base, command="cv-compiler-no-such-codex")
+        with self.assertRaisesRegex(ValueError, "command not found"):
+            CodexExecProvider(config)
+
+    def test_answer_comes_from_last_message_file(self) -> None:
+        script = (
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "args = sys.argv[1:]\n"
+            "sys.stdin.read()\n"
+            "print('log line with { stray braces')\n"
+            "path = args[args.index('--output-last-message') + 1]\n"
+            "open(path, 'w').write('{\"ok\": true}')\n"
+        )
+        with _clear_env(["CV_CODEX_ARGS", "CV_CODEX_CACHE", "CV_CODEX_PROGRESS"]):
+            base = CodexExecConfig.from_env(env_path=None)
+        with tempfile.TemporaryDirectory() as tmp:
+            fake_codex = Path(tmp) / "codex"
+            fake_codex.write_text(script, encoding="utf-8")
+            fake_codex.chmod(0o755)
+            provider = CodexExecProvider(dataclasses.replace(base, command=str(fake_codex)))
+            self.assertEqual(provider._run_codex("prompt", str), '{"ok": true}')
+
+    def test_spinner_drains_large_stderr(self) -> None:
+        script = "import sys; sys.stdin.read(); sys.stderr.write('x' * 300_000)"
+        result = _run_codex_with_spinner(
+            [sys.executable, "-c", script],
+            prompt="prompt",
+            prompt_mode="stdin",
+            timeout=30,
+        )
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(len(result.stderr), 300_000)
+
+    def test_only_one_run_draws_the_spinner(self) -> None:
+        script = "import sys, time; sys.stdin.read(); time.sleep(1.2)"
+        stderr = io.StringIO()
+        with _SPINNER_LOCK, redirect_stderr(stderr):
+            result = _run_codex_with_spinner(
+                [sys.executable, "-c", script],
+                prompt="prompt",
+                prompt_mode="stdin",
+                timeout=30,
+            )
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(stderr.getvalue(), "")
+
     def test_full_auto_default(self) -> None:
         self.assertEqual(_ensure_full_auto(()), ("--full-auto",))
 
@@ -0,0 +1,38 @@
+"""
+Tests for selection explanation formatting.
+"""
+
+from __future__ import annotations
+
+import io
+import unittest
+
+from cv_compiler.explain import format_selection_explanation, write_selection_explanation
+from cv_compiler.select.types import SelectionDecision, SelectionResult
+
+
+class TestExplain(unittest.TestCase):
+    def test_orders_by_score_then_id_and_streams_same_text(self) -> None:
+        selection = SelectionResult(
+            selected_experience_ids=("exp_b",),
+            selected_project_ids=(),
+            decisions=(
+                SelectionDecision("proj_a", 1.0, (), ()),
+                SelectionDecision("exp_b", 2.0, ("python",), ("tag_matches=1",)),
+                SelectionDecision("exp_a", 1.0, (), ()),
+            ),
+        )
+
+        text = format_selection_explanation(selection)
+        out = io.StringIO()
+        write_selection_explanation(selection, out)
+
+        self.assertEqual(
+            text.splitlines()[2:],
+            [
+                "- IN exp_b score=2.000 matched=[python] tag_matches=1",
+                "- OUT exp_a score=1.000 matched=[-] -",
+                "- OUT proj_a score=1.000 matched=[-] -",
+            ],
+        )
+        self.assertEqual(out.getvalue(), text + "\n")
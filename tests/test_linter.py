@@ -0,0 +1,56 @@
+"""
+Tests for canonical data linting.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from cv_compiler.lint.linter import lint_build_inputs
+from cv_compiler.schema.models import CanonicalData, ExperienceEntry, Profile, Skills
+
+
+def _data(*bullets: str) -> CanonicalData:
+    profile = Profile(
+        id="profile",
+        name="Test User",
+        headline="Engineer",
+        location="Remote",
+        email=None,
+        links=(),
+        about_me="Builds systems.",
+    )
+    experience = ExperienceEntry(
+        id="exp_1",
+        company="Acme",
+        title="Dev",
+        location=None,
+        start_date="2022-01",
+        end_date=None,
+        tags=(),
+        keywords=(),
+        bullets=bullets,
+    )
+    return CanonicalData(
+        profile=profile,
+        experience=(experience,),
+        projects=(),
+        skills=Skills(id="skills", categories=()),
+        education=None,
+    )
+
+
+class TestLinter(unittest.TestCase):
+    def test_ascii_bullets_pass(self) -> None:
+        self.assertEqual(lint_build_inputs(_data("Shipped a service.", "Cut latency by 30%.")), ())
+
+    def test_reports_first_non_ascii_character_once(self) -> None:
+        issues = lint_build_inputs(_data("Shipped a café — service."))
+
+        self.assertEqual([issue.code for issue in issues], ["UNICODE_NON_ASCII"])
+        self.assertIn("'é'", issues[0].message)
+
+    def test_reports_newlines_and_tabs(self) -> None:
+        issues = lint_build_inputs(_data("Line one\nline two", "Tab\there"))
+
+        self.assertEqual([issue.code for issue in issues], ["TEXT_NEWLINE", "TEXT_TAB"])
@@ -27,6 +27,28 @@ class TestLLMConfig(unittest.TestCase):
             self.assertEqual(config.model, "qwen")
             self.assertEqual(config.timeout_seconds, 42)
 
+    def test_from_env_reuses_result_until_inputs_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            env_path = Path(tmp) / "llm.env"
+            env_path.write_text("CV_LLM_BASE_URL=http://file\nCV_LLM_MODEL=a\n", encoding="utf-8")
+            first = LLMConfig.from_env(env_path=env_path)
+            self.assertIs(LLMConfig.from_env(env_path=env_path), first)
+            env_path.write_text("CV_LLM_BASE_URL=http://file\nCV_LLM_MODEL=bb\n", encoding="utf-8")
+            edited = LLMConfig.from_env(env_path=env_path)
+            assert edited is not None
+            self.assertEqual(edited.model, "bb")
+            old_model = os.environ.get("CV_LLM_MODEL")
+            os.environ["CV_LLM_MODEL"] = "env-model"
+            try:
+                overridden = LLMConfig.from_env(env_path=env_path)
+                assert overridden is not None
+                self.assertEqual(overridden.model, "env-model")
+            finally:
+                if old_model is None:
+                    os.environ.pop("CV_LLM_MODEL", None)
+                else:
+                    os.environ["CV_LLM_MODEL"] = old_model
+
     def test_env_overrides_file(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             env_path = Path(tmp) / "llm.env"
@@ -67,3 +89,16 @@ class TestLLMConfig(unittest.TestCase):
             upsert_env_value(env_path, "CV_LLM_MODE", "offline")
             values = read_env_file(env_path)
             self.assertEqual(values.get("CV_LLM_MODE"), "offline")
+
+    def test_read_env_file_returns_fresh_copy_and_sees_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            env_path = Path(tmp) / "llm.env"
+            env_path.write_text("# comment\nCV_LLM_MODEL='a'\r\nBROKEN\n", encoding="utf-8")
+            values = read_env_file(env_path)
+            self.assertEqual(values, {"CV_LLM_MODEL": "a"})
+            values["CV_LLM_MODEL"] = "mutated"
+            self.assertEqual(read_env_file(env_path), {"CV_LLM_MODEL": "a"})
+            upsert_env_value(env_path, "CV_LLM_MODE", "offline")
+            self.assertEqual(
+                read_env_file(env_path), {"CV_LLM_MODE": "offline", "CV_LLM_MODEL": "a"}
+            )
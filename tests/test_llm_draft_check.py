@@ -4,10 +4,13 @@ Tests for LLM draft validation helpers.
 
 from __future__ import annotations
 
+import json
+import tempfile
 import unittest
+from pathlib import Path
 
 from cv_compiler.schema.models import ProjectEntry
-from cv_compiler.tools.llm_draft_check import collect_draft_issues
+from cv_compiler.tools.llm_draft_check import collect_draft_issues, load_draft_text
 
 
 class TestLlmDraftCheck(unittest.TestCase):
@@ -62,3 +65,15 @@ experiences:
         issues = collect_draft_issues(draft_text=draft_text, projects=projects)
         codes = [issue.code for issue in issues]
         self.assertIn("MISSING_ROLE", codes)
+
+    def test_load_draft_text_unwraps_chat_json_and_keeps_yaml(self) -> None:
+        yaml_draft = "experiences:\n  - id: exp_acme_2023\n"
+        chat = {"choices": [{"message": {"content": yaml_draft}}]}
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / "draft.json"
+            json_path.write_text(json.dumps(chat), encoding="utf-8")
+            yaml_path = Path(tmp) / "draft.yaml"
+            yaml_path.write_text(yaml_draft, encoding="utf-8")
+
+            self.assertEqual(load_draft_text(json_path), yaml_draft)
+            self.assertEqual(load_draft_text(yaml_path), yaml_draft)
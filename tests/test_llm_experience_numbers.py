@@ -9,7 +9,7 @@ import unittest
 from pathlib import Path
 
 from cv_compiler.llm.base import ExperienceDraft
-from cv_compiler.llm.experience import write_experience_artifacts
+from cv_compiler.llm.experience import _collect_allowed_numbers, write_experience_artifacts
 from cv_compiler.schema.models import ProjectEntry
 
 
@@ -43,3 +43,20 @@ class TestLlmExperienceNumbers(unittest.TestCase):
 
             self.assertEqual(len(written), 1)
             self.assertTrue(written[0].exists())
+
+    def test_allowed_numbers_are_reused_for_equal_projects(self) -> None:
+        def make_project() -> ProjectEntry:
+            return ProjectEntry(
+                id="proj_acme",
+                name="Importer v2",
+                company="Acme",
+                role=None,
+                start_date="2024-01",
+                end_date=None,
+                tags=(),
+                bullets=("Cut load time by 40%.",),
+            )
+
+        first = _collect_allowed_numbers((make_project(),))
+        self.assertEqual(first, frozenset({"2", "2024", "01", "40%"}))
+        self.assertIs(_collect_allowed_numbers((make_project(),)), first)
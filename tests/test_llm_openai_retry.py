@@ -0,0 +1,78 @@
+"""
+Tests for retrying transient failures in the OpenAI-compatible client.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from email.message import Message
+from unittest import mock
+from urllib.error import HTTPError
+
+from cv_compiler.llm.config import LLMConfig
+from cv_compiler.llm.openai import request_chat_completion
+
+
+def _response(content: str) -> io.BytesIO:
+    body = {"choices": [{"message": {"content": content}}]}
+    return io.BytesIO(json.dumps(body).encode("utf-8"))
+
+
+def _http_error(code: int, retry_after: str | None = None) -> HTTPError:
+    headers = Message()
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+    return HTTPError("http://llm/v1/chat/completions", code, "error", headers, None)
+
+
+class TestRequestRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = LLMConfig(base_url="http://llm", model="m")
+        sleep = mock.patch("cv_compiler.llm.openai.time.sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def test_retries_rate_limit_then_succeeds(self) -> None:
+        with mock.patch(
+            "cv_compiler.llm.openai.urlopen", side_effect=[_http_error(429), _response("ok")]
+        ) as urlopen:
+            content = request_chat_completion(self.config, "prompt", response_format={})
+        self.assertEqual(content, "ok")
+        self.assertEqual(urlopen.call_count, 2)
+        self.sleep.assert_called_once()
+
+    def test_invalid_retry_after_falls_back_to_backoff(self) -> None:
+        for retry_after in ("-1", "nan", "Wed, 21 Oct 2015 07:28:00 GMT"):
+            with self.subTest(retry_after=retry_after):
+                self.sleep.reset_mock()
+                with mock.patch(
+                    "cv_compiler.llm.openai.urlopen",
+                    side_effect=[_http_error(503, retry_after), _response("ok")],
+                ):
+                    content = request_chat_completion(self.config, "prompt", response_format={})
+                self.assertEqual(content, "ok")
+                self.sleep.assert_called_once_with(1.0)
+
+    def test_zero_retry_after_is_honoured(self) -> None:
+        with mock.patch(
+            "cv_compiler.llm.openai.urlopen",
+            side_effect=[_http_error(429, "0"), _response("ok")],
+        ):
+            content = request_chat_completion(self.config, "prompt", response_format={})
+        self.assertEqual(content, "ok")
+        self.sleep.assert_called_once_with(0.0)
+
+    def test_client_error_is_not_retried(self) -> None:
+        with mock.patch(
+            "cv_compiler.llm.openai.urlopen", side_effect=[_http_error(400)]
+        ) as urlopen:
+            with self.assertRaises(HTTPError):
+                request_chat_completion(self.config, "prompt", response_format={})
+        self.assertEqual(urlopen.call_count, 1)
+        self.sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
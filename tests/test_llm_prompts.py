@@ -0,0 +1,54 @@
+"""
+Tests for cached prompt-file loading.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from cv_compiler.llm.experience import (
+    ExperienceTemplate,
+    build_experience_prompt,
+    load_experience_templates,
+)
+from cv_compiler.llm.prompts import read_prompt_text
+
+
+class TestPromptLoading(unittest.TestCase):
+    def test_read_prompt_text_sees_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "prompt.md"
+            path.write_text("first", encoding="utf-8")
+            self.assertEqual(read_prompt_text(path), "first")
+            path.write_text("second version", encoding="utf-8")
+            self.assertEqual(read_prompt_text(path), "second version")
+
+    def test_templates_are_reused_until_the_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "templates.yaml"
+            path.write_text("- id: a\n  template: Did {x}.\n", encoding="utf-8")
+            first = load_experience_templates(path)
+            self.assertIs(load_experience_templates(path), first)
+            path.write_text("- id: b\n  template: Did {x}.\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual([t.id for t in load_experience_templates(path)], ["b"])
+
+    def test_experience_prompt_fills_each_placeholder_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "prompt.md"
+            path.write_text("T:\n{{TEMPLATES}}\nP:\n{{PROJECTS}}\nJ:\n{{JOB}}\n", encoding="utf-8")
+            prompt = build_experience_prompt(
+                path,
+                templates=(ExperienceTemplate(id="a", template="Did {{JOB}}."),),
+                projects=(),
+                job=None,
+            )
+        self.assertEqual(prompt, "T:\n- id: a\n  template: Did {{JOB}}.\nP:\n[]\nJ:\n{}\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,18 +4,26 @@ Tests for PDF ingestion helpers.
 
 from __future__ import annotations
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from cv_compiler.ingest.pdf_ingest import (
     ParsedCv,
     ParsedExperience,
     ParsedProfile,
     ParsedSkillCategory,
+    _manual_llm_content,
+    _request_llm_cv,
+    _slugify,
+    _unique_id,
+    extract_pdf_text,
     parse_ingest_payload,
     write_ingest_files,
 )
+from cv_compiler.llm.config import LLMConfig
 from cv_compiler.parse.frontmatter import parse_markdown_frontmatter
 
 
@@ -134,3 +142,93 @@ class TestPdfIngest(unittest.TestCase):
             if backup_root.exists():
                 backups = list(backup_root.glob("ingest_backup_*"))
                 self.assertEqual(backups, [])
+
+    def test_extract_pdf_text_skips_pages_without_fonts(self) -> None:
+        from fpdf import FPDF
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = FPDF()
+            pdf.add_page()
+            pdf.rect(10, 10, 50, 50)
+            pdf.add_page()
+            pdf.set_font("Helvetica", size=12)
+            pdf.multi_cell(0, 5, "Built reliable data pipelines for analytics teams. " * 10)
+            text_path = Path(tmp) / "text.pdf"
+            pdf.output(str(text_path))
+
+            self.assertIn("reliable data pipelines", extract_pdf_text(text_path))
+
+            pdf = FPDF()
+            pdf.add_page()
+            pdf.rect(10, 10, 50, 50)
+            image_path = Path(tmp) / "image.pdf"
+            pdf.output(str(image_path))
+
+            with self.assertRaisesRegex(ValueError, "1 page\\(s\\) have no fonts"):
+                extract_pdf_text(image_path)
+
+            with self.assertRaisesRegex(ValueError, "PDF has 2 pages; at most 1"):
+                extract_pdf_text(text_path, max_pages=1)
+
+    def test_request_llm_cv_reuses_cached_response(self) -> None:
+        config = LLMConfig(base_url="http://llm", model="m")
+        content = json.dumps({"profile": {"name": "Jane Doe"}})
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / "cache"
+            with mock.patch(
+                "cv_compiler.ingest.pdf_ingest.request_chat_completion", return_value=content
+            ) as request:
+                first = _request_llm_cv(config, "prompt", cache_dir=cache_dir)
+                second = _request_llm_cv(config, "prompt", cache_dir=cache_dir)
+                _request_llm_cv(config, "other prompt", cache_dir=cache_dir)
+            self.assertEqual(first, second)
+            self.assertEqual(first.profile.name, "Jane Doe")
+            self.assertEqual(request.call_count, 2)
+
+    def test_request_llm_cv_does_not_cache_invalid_response(self) -> None:
+        config = LLMConfig(base_url="http://llm", model="m")
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / "cache"
+            with mock.patch(
+                "cv_compiler.ingest.pdf_ingest.request_chat_completion", return_value="{}"
+            ) as request:
+                for _ in range(2):
+                    with self.assertRaisesRegex(ValueError, "profile"):
+                        _request_llm_cv(config, "prompt", cache_dir=cache_dir)
+            self.assertEqual(request.call_count, 2)
+            self.assertFalse(cache_dir.exists())
+
+    def test_unique_id_resumes_suffix_per_base(self) -> None:
+        used = {"proj_a_3"}
+        next_suffix: dict[str, int] = {}
+        ids = []
+        for _ in range(4):
+            ids.append(_unique_id("proj_a", used, next_suffix))
+            used.add(ids[-1])
+        self.assertEqual(ids, ["proj_a", "proj_a_2", "proj_a_4", "proj_a_5"])
+
+    def test_manual_llm_content_unwraps_response_shapes(self) -> None:
+        inner = '{"profile": {}}'
+        responses = {
+            "chat": json.dumps({"choices": [{"message": {"content": inner}}]}),
+            "direct": json.dumps({"content": inner}),
+            "payload": inner,
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            request_path = Path(tmp) / "request.json"
+            response_path = Path(tmp) / "response.json"
+            for shape, raw in responses.items():
+                response_path.write_text(raw, encoding="utf-8")
+                content = _manual_llm_content(
+                    payload={},
+                    request_path=request_path,
+                    response_path=response_path,
+                    base_url=None,
+                )
+                self.assertEqual(content, inner, shape)
+
+    def test_slugify_collapses_unsafe_runs(self) -> None:
+        self.assertEqual(_slugify("proj_Data Platform (v2) - Acme"), "proj_data_platform_v2_acme")
+        self.assertEqual(_slugify("  __a _ b__ "), "a___b")
+        self.assertEqual(_slugify("proj_Café Ops"), "proj_caf_ops")
+        self.assertEqual(_slugify("!!!"), "item")
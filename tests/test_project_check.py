@@ -7,7 +7,9 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from cv_compiler.tools import project_check
 from cv_compiler.tools.project_check import collect_project_issues
 
 
@@ -26,6 +28,15 @@ class TestProjectCheck(unittest.TestCase):
             self.assertTrue(any("`tags`" in msg for msg in messages))
             self.assertTrue(any("`bullets`" in msg for msg in messages))
 
+    def test_projects_path_that_is_a_file_is_reported_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects_file = Path(tmp) / "projects"
+            projects_file.write_text("not a folder", encoding="utf-8")
+
+            issues = collect_project_issues(projects_file)
+
+            self.assertEqual([issue.code for issue in issues], ["PROJECTS_DIR_MISSING"])
+
     def test_reports_duplicate_ids(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             projects_dir = Path(tmp) / "data" / "projects"
@@ -38,3 +49,30 @@ class TestProjectCheck(unittest.TestCase):
             codes = [issue.code for issue in issues]
 
             self.assertIn("PROJECT_ID_DUPLICATE", codes)
+
+    def test_cache_reuses_unchanged_files_and_rechecks_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects_dir = Path(tmp) / "data" / "projects"
+            projects_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = Path(tmp) / ".cache" / "project_check.json"
+            content = '---\nid: proj_dup\nname: Test\nbullets: ["One"]\ntags: ["tag"]\n---\n'
+            (projects_dir / "proj_one.md").write_text(content, encoding="utf-8")
+            bad_path = projects_dir / "proj_two.md"
+            bad_path.write_text(content, encoding="utf-8")
+
+            first = collect_project_issues(projects_dir, cache_path=cache_path)
+            self.assertTrue(cache_path.exists())
+            with mock.patch.object(
+                project_check, "_check_project_file", wraps=project_check._check_project_file
+            ) as check_file:
+                second = collect_project_issues(projects_dir, cache_path=cache_path)
+                self.assertEqual(check_file.call_count, 0)
+                self.assertEqual(first, second)
+                self.assertIn("PROJECT_ID_DUPLICATE", [issue.code for issue in second])
+
+                bad_path.write_text("---\nname: Test\n---\n", encoding="utf-8")
+                third = collect_project_issues(projects_dir, cache_path=cache_path)
+                self.assertEqual(check_file.call_count, 1)
+            codes = [issue.code for issue in third]
+            self.assertNotIn("PROJECT_ID_DUPLICATE", codes)
+            self.assertTrue(any(issue.path == bad_path for issue in third))
@@ -5,8 +5,10 @@ Tests for LLM skill highlight parsing.
 from __future__ import annotations
 
 import unittest
+from pathlib import Path
 
-from cv_compiler.llm.skills import parse_skill_highlights
+from cv_compiler.llm.skills import build_skills_prompt, parse_skill_highlights
+from cv_compiler.schema.models import JobSpec, Profile
 
 
 class TestSkillHighlights(unittest.TestCase):
@@ -21,3 +23,27 @@ class TestSkillHighlights(unittest.TestCase):
         text = '{"highlighted_skills": ["Kubernetes"]}'
         with self.assertRaises(ValueError):
             parse_skill_highlights(text, allowed_skills=allowed)
+
+    def test_skills_prompt_puts_job_last(self) -> None:
+        root = Path(__file__).resolve().parents[1]
+        profile = Profile(
+            id="profile",
+            name="Jane Doe",
+            headline="Backend engineer",
+            location="Remote",
+            email=None,
+            links=(),
+            about_me="Builds reliable systems.",
+        )
+        prompts = [
+            build_skills_prompt(
+                root / "prompts" / "skills_highlight_prompt.md",
+                skills=("Python", "Docker"),
+                profile=profile,
+                job=JobSpec(id=job_id, title=job_id, raw_text=job_id, keywords=()),
+            )
+            for job_id in ("backend", "platform")
+        ]
+        prefix = prompts[0].split("JOB (optional")[0]
+        self.assertIn("- Docker", prefix)
+        self.assertTrue(prompts[1].startswith(prefix))